@@ -25,54 +25,54 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
-from hoagiemeal.logger import logger
-from hoagiemeal.utils import deprecated
-from student_app import StudentApp
+import asyncio
+from typing import ClassVar
+
+from hoagiemeal.utils.logger import logger
+from hoagiemeal.utils.deprecated import deprecated
+from hoagiemeal.api.student_app import StudentApp
 
 # TODO: This file is incomplete.
 class Courses(StudentApp):
     """Handle logic related to academics at Princeton."""
 
-    def __init__(self):
-        super().__init__()
-        self.COURSES_TERMS = "/courses/terms"
-        self.COURSES_COURSES = "/courses/courses"
-        self.COURSES_SEATS = "/courses/seats"
-        self.COURSES_RESSEATS = "/courses/resseats"
-        self.COURSES_DETAILS = "/courses/details"
+    COURSES_TERMS: ClassVar[str] = "/courses/terms"
+    COURSES_COURSES: ClassVar[str] = "/courses/courses"
+    COURSES_SEATS: ClassVar[str] = "/courses/seats"
+    COURSES_RESSEATS: ClassVar[str] = "/courses/resseats"
+    COURSES_DETAILS: ClassVar[str] = "/courses/details"
 
-    def get_terms(self, fmt: str = "json") -> dict:
+    async def get_terms(self, fmt: str = "json") -> dict:
         """Fetch the latest academic term (TODO: ?)."""
         params = {"fmt": fmt}
-        response = self._make_request(self.COURSES_TERMS, params=params, fmt=fmt)
+        response = await self._make_request(self.COURSES_TERMS, params=params, fmt=fmt)
         return self._parse_xml(response) if fmt == "xml" else response
 
-    def get_courses(self, term: str = "", subject: str = "", catnum: str = "", search: str = "", fmt: str = "json") -> dict:
+    async def get_courses(self, term: str = "", subject: str = "", catnum: str = "", search: str = "", fmt: str = "json") -> dict:
         """Fetch a list of courses for a given term, with optional filters."""
-        params = {"term": term, "subject": subject, "catnum": catnum, "search": search, fmt: fmt}
-        
-        return self._make_request(self.COURSES_COURSES, params=params, fmt=fmt)
+        params = {"term": term, "subject": subject, "catnum": catnum, "search": search, "fmt": fmt}
+        return await self._make_request(self.COURSES_COURSES, params=params, fmt=fmt)
 
-    def get_seats(self, term: str, course_ids: str, fmt: str = "json") -> dict:
+    async def get_seats(self, term: str, course_ids: str, fmt: str = "json") -> dict:
         """Fetch the seat information for specified courses."""
         params = {"term": term, "course_ids": course_ids}
-        return self._make_request(self.COURSES_SEATS, params=params, fmt=fmt)
+        return await self._make_request(self.COURSES_SEATS, params=params, fmt=fmt)
 
-    def get_reserved_seats(self, term: str, course_ids: str, fmt: str = "json") -> dict:
+    async def get_reserved_seats(self, term: str, course_ids: str, fmt: str = "json") -> dict:
         """Fetch reserved seat data for specified courses."""
         params = {"term": term, "course_ids": course_ids}
-        return self._make_request(self.COURSES_RESSEATS, params=params, fmt=fmt)
+        return await self._make_request(self.COURSES_RESSEATS, params=params, fmt=fmt)
 
-    def get_course_details(self, term: str, course_id: str, fmt: str = "json") -> dict:
+    async def get_course_details(self, term: str, course_id: str, fmt: str = "json") -> dict:
         """Fetch detailed course information for a specific course."""
         params = {"term": term, "course_id": course_id}
-        return self._make_request(self.COURSES_DETAILS, params=params, fmt=fmt)
+        return await self._make_request(self.COURSES_DETAILS, params=params, fmt=fmt)
 
 
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_get_terms():
     courses = Courses()
-    response = courses.get_terms(fmt="xml")
+    response = asyncio.run(courses.get_terms(fmt="xml"))
     logger.info(f"get_terms result: {response}")
 
 
@@ -86,28 +86,28 @@ def _test_get_courses():
         # "search": "Text string to search for."
         "fmt": "json",
     }
-    response = courses.get_courses(**params)
+    response = asyncio.run(courses.get_courses(**params))
     logger.info(f"get_courses result: {response}")
 
 
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_get_seats():
     courses = Courses()
-    response = courses.get_seats(term="1252", course_ids="CS101")
+    response = asyncio.run(courses.get_seats(term="1252", course_ids="CS101"))
     logger.info(f"get_seats result: {response}")
 
 
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_get_reserved_seats():
     courses = Courses()
-    response = courses.get_reserved_seats(term="1252", course_ids="CS101")
+    response = asyncio.run(courses.get_reserved_seats(term="1252", course_ids="CS101"))
     logger.info("get_reserved_seats result:", response)
 
 
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_get_course_details():
     courses = Courses()
-    response = courses.get_course_details(term="2024FA", course_id="CS101")
+    response = asyncio.run(courses.get_course_details(term="2024FA", course_id="CS101"))
     logger.info("get_course_details result:", response)
 
 
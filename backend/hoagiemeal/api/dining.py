@@ -21,29 +21,64 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
+import random
+from typing import ClassVar
+
+import msgspec
 import msgspec.json as msj
+from lxml import etree
 
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
 from rest_framework.exceptions import APIException
+from django.conf import settings
+from django.http import HttpResponse
 from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_GET
 
+from hoagiemeal.utils.cache import parsed_cache
 from hoagiemeal.utils.logger import logger
-from hoagiemeal.api.student_app import StudentApp
-from hoagiemeal.api.schemas import Schemas
+from hoagiemeal.api.student_app import StudentApp, close_session
+from hoagiemeal.api.schemas import Location, MenuResponse, schemas_api
+
+_MENU_DECODER = msj.Decoder(MenuResponse)
+# Falls back to str() for values msgspec cannot encode natively, such as icalendar's vText.
+_ENCODER = msj.Encoder(enc_hook=str)
 
 
 class DiningAPI(StudentApp):
     """Handle functionalities related to dining information, such as locations, menus, and events."""
 
-    def __init__(self):
-        super().__init__()
-        self.DINING_LOCATIONS = "/dining/locations"
-        self.DINING_EVENTS = "/dining/events"
-        self.DINING_MENU = "/dining/menu"
-        self.schemas = Schemas()
+    DINING_LOCATIONS: ClassVar[str] = "/dining/locations"
+    DINING_EVENTS: ClassVar[str] = "/dining/events"
+    DINING_MENU: ClassVar[str] = "/dining/menu"
+
+    # Compiled dining XSD and a parser validating against it, built once per process and
+    # shared by every instance.
+    _DINING_SCHEMA: ClassVar[etree.XMLSchema | None] = None
+    _DINING_PARSER: ClassVar[etree.XMLParser | None] = None
+
+    async def get_dining_schema(self) -> etree.XMLSchema:
+        """Return the compiled dining XSD, fetching it from the API on first use."""
+        if DiningAPI._DINING_SCHEMA is None:
+            xsd = await schemas_api.get_dining_xsd()
+            DiningAPI._DINING_SCHEMA = etree.XMLSchema(etree.fromstring(xsd))
+            logger.info("Dining XSD schema compiled.")
+        return DiningAPI._DINING_SCHEMA
+
+    async def get_dining_parser(self) -> etree.XMLParser:
+        """Return an XML parser that validates against the dining XSD while parsing.
 
-    def get_locations(self, fmt: str = "xml") -> dict:
+        Documents that fail validation raise `etree.XMLSyntaxError` from the parse itself,
+        so no separate validation pass over the tree is needed.
+        """
+        if DiningAPI._DINING_PARSER is None:
+            DiningAPI._DINING_PARSER = etree.XMLParser(
+                schema=await self.get_dining_schema(), remove_comments=True, remove_pis=True
+            )
+        return DiningAPI._DINING_PARSER
+
+    @parsed_cache(timeout=60 * 15)
+    async def get_locations(self, fmt: str = "xml") -> dict:
         """Fetch a list of dining locations in XML format.
 
         NOTE: The API expects the parameters to be in camelCase.
@@ -56,20 +91,30 @@ class DiningAPI(StudentApp):
 
         """
         try:
-            response = self._make_request(
+            response = await self._make_request(
                 self.DINING_LOCATIONS,
                 params={"categoryId": "2"},
                 fmt=fmt,
             )
-            schema = self.schemas.get_dining_xsd()
-            if not self.validate_xml(response, schema):
-                raise APIException("Invalid XML format for dining locations")
-            return self._parse_xml(response)
+            if settings.VALIDATE_UPSTREAM_XML:
+                # Validate while parsing, then convert the same tree.
+                try:
+                    response = etree.fromstring(response, await self.get_dining_parser())
+                except etree.XMLSyntaxError as e:
+                    raise APIException(f"Invalid XML format for dining locations: {e}") from e
+            elif random.random() < settings.VALIDATE_UPSTREAM_XML_SAMPLE_RATE:
+                # Parse once, validate the tree, then convert the same tree.
+                response = etree.fromstring(response, etree.XMLParser(remove_comments=True, remove_pis=True))
+                if not self.validate_xml(response, await self.get_dining_schema()):
+                    logger.warning("Sampled dining locations response failed XSD validation.")
+            locations = self._iterparse_xml(response, "location", force_list=("amenity",))
+            return {"locations": {"location": list(locations)}}
         except Exception as e:
             logger.error(f"Error fetching dining locations: {e}")
             raise APIException(str(e)) from e
 
-    def get_events(self, place_id: str = "1007") -> dict:
+    @parsed_cache(timeout=60 * 5)
+    async def get_events(self, place_id: str = "1007") -> dict:
         """Fetch dining venue open hours as an iCal stream for a given place_id.
 
         NOTE: "1007" seems to correspond to the Princeton Dining Calendar.
@@ -86,13 +131,14 @@ class DiningAPI(StudentApp):
 
         """
         try:
-            response = self._make_request(self.DINING_EVENTS, params={"placeId": place_id}, fmt="ical")
+            response = await self._make_request(self.DINING_EVENTS, params={"placeId": place_id}, fmt="ical")
             return self._parse_ical(response)
         except Exception as e:
             logger.error(f"Error fetching dining events: {e}")
             raise APIException(str(e)) from e
 
-    def get_menu(self, location_id: str, menu_id: str) -> dict:
+    @parsed_cache(timeout=60 * 5)
+    async def get_menu(self, location_id: str, menu_id: str) -> MenuResponse:
         """Fetch the menu for a specific dining location.
 
         NOTE: The API expects the parameters to be in camelCase.
@@ -102,50 +148,207 @@ class DiningAPI(StudentApp):
             menu_id (str): The ID of the dining menu.
 
         Returns:
-            dict: A JSON object containing the menu details.
+            MenuResponse: The menu details, with each item kept as raw JSON.
 
         """
         try:
-            response = self._make_request(self.DINING_MENU, params={"locationId": location_id, "menuId": menu_id})
-            return msj.decode(response)
+            response = await self._make_request(self.DINING_MENU, params={"locationId": location_id, "menuId": menu_id})
+            return _MENU_DECODER.decode(response)
         except Exception as e:
             logger.error(f"Error fetching menu: {e}")
             raise APIException(str(e)) from e
 
 
+def _test_dining_locations():
+    # Reuse the module-level instance so the tests share one token and connection pool.
+    dining = dining_api
+
+    # Test: Get Dining Locations
+    logger.info("Testing: Get Dining Locations...")
+    try:
+        locations_xml = asyncio.run(dining.get_locations(fmt="xml"))
+        logger.info(f"Dining Locations (Parsed XML): {locations_xml}")
+
+        # Extract location IDs with corresponding names
+        locations = locations_xml.get("locations", {}).get("location", [])
+        location_id_name_pairs = []
+
+        for loc in locations:
+            building = loc.get("building", {})
+            location_id = building.get("location_id", "Unknown ID")
+            location_name = loc.get("name", "Unknown Name")
+            location_id_name_pairs.append((location_id, location_name))
+
+        logger.info(f"Location ID and Name Pairs: {location_id_name_pairs}")
+        logger.info(f"Location ID length: {len(location_id_name_pairs)}")
+        return location_id_name_pairs
+
+    except Exception as e:
+        logger.error(f"Error fetching dining locations: {e}")
+
+
+def _test_get_events():
+    dining = dining_api
+    logger.info("Testing: Get Dining Events...")
+    try:
+        events = asyncio.run(dining.get_events(place_id="1007"))  # 1007 ~ Princeton Dining Calendar?
+        logger.info(f"Dining Events fetched: {events}")
+
+        for event in events.get("events", []):
+            summary = event.get("summary", "No Summary")
+            start = event.get("start", "No Start Time")
+            end = event.get("end", "No End Time")
+            uid = event.get("uid", "No UID")
+            description = event.get("description", "No Description")
+            logger.info(
+                f"Event Summary: {summary}, Start: {start}, End: {end}, UID: {uid}, Description: {description}"
+            )
+
+    except Exception as e:
+        logger.error(f"Error fetching dining events: {e}")
+
+
+async def _test_dining_apis():
+    dining = dining_api
+    response = await dining.get_locations()
+    locations = []
+
+    # Decode into typed structs once; latitude/longitude arrive as XML text, hence strict=False.
+    for location in msgspec.convert(response["locations"]["location"], list[Location], strict=False):
+        name = location.name
+        dbid = location.dbid
+        amenities = [amenity.name for amenity in location.amenities.amenity]
+        logger.info(
+            "\n".join(
+                [
+                    f"Location Name: {name}",
+                    f"Map Name: {location.mapName}",
+                    f"Database ID: {dbid}",
+                    f"Latitude: {location.geoloc.lat}",
+                    f"Longitude: {location.geoloc.long}",
+                    f"Building Name: {location.building.name}",
+                    f"Amenities: {', '.join(amenities)}",
+                    "---" * 40,
+                ]
+            )
+        )
+        locations.append((name, dbid))
+
+    # Fetch every location's menu concurrently over the shared session.
+    menus = await asyncio.gather(
+        *(dining.get_menu(location_id=dbid, menu_id="2024-11-18-Lunch") for _, dbid in locations),
+        return_exceptions=True,
+    )
+    await close_session()
+
+    for (name, dbid), menu_data in zip(locations, menus, strict=True):
+        if isinstance(menu_data, Exception):
+            logger.error(f"Exception occurred: {menu_data}")
+            logger.error(f"Location Details - Name: {name}, DBID: {dbid}")
+            continue
+
+        logger.debug(f"Raw menu data fetched: {menu_data}")
+
+        if menu_data.menus:
+            logger.info(f"Dining Menu for {name}:")
+            for item in menu_data.items():
+                logger.info(f" - Menu Item ID: {item.id}")
+                logger.info(f"   Name: {item.name}")
+                logger.info(f"   Description: {item.description}")
+                logger.info(f"   Link: {item.link}") # Scrape data from this link
+            logger.info("---" * 40)
+        else:
+            logger.warning(f"No valid menu data available for {name} (location ID: {dbid}).")
+
+
 #################### Exposed endpoints #########################
 
 dining_api = DiningAPI()
 
 
-@api_view(["GET"])
+def _json_response(payload: dict, status: int = 200) -> HttpResponse:
+    """Serialize a payload with msgspec into a JSON HttpResponse."""
+    return HttpResponse(_ENCODER.encode(payload), status=status, content_type="application/json")
+
+
+@require_GET
 @cache_page(60 * 15)
-def get_locations(request):
+async def get_locations(request):
     """Get all dining locations."""
-    locations = dining_api.get_locations()
+    try:
+        locations = await dining_api.get_locations()
+    except APIException as e:
+        return _json_response({"detail": str(e.detail)}, status=e.status_code)
     location_list = locations.get("locations", {}).get("location", [])
-    return Response({"data": location_list, "message": "Successfully fetched dining locations"})
+    return _json_response({"data": location_list, "message": "Successfully fetched dining locations"})
 
 
-@api_view(["GET"])
+@require_GET
 @cache_page(60 * 5)
-def get_events(request):
+async def get_events(request):
     """Get dining events/hours."""
-    place_id = request.query_params.get("place_id", "1007")
-    events = dining_api.get_events(place_id)
-    return Response({"data": events.get("events", []), "message": "Successfully fetched dining events"})
+    place_id = request.GET.get("place_id", "1007")
+    try:
+        events = await dining_api.get_events(place_id)
+    except APIException as e:
+        return _json_response({"detail": str(e.detail)}, status=e.status_code)
+    return _json_response({"data": events.get("events", []), "message": "Successfully fetched dining events"})
 
 
-@api_view(["GET"])
+@require_GET
 @cache_page(60 * 5)
-def get_menu(request):
+async def get_menu(request):
     """Get menu for a specific location."""
-    location_id = request.query_params.get("location_id")
-    menu_id = request.query_params.get("menu_id")
+    location_id = request.GET.get("location_id")
+    menu_id = request.GET.get("menu_id")
 
     if not location_id or not menu_id:
-        return Response({"error": "location_id and menu_id are required"}, status=400)
+        return _json_response({"error": "location_id and menu_id are required"}, status=400)
 
-    menu = dining_api.get_menu(location_id, menu_id)
+    try:
+        menu = await dining_api.get_menu(location_id, menu_id)
+    except APIException as e:
+        return _json_response({"detail": str(e.detail)}, status=e.status_code)
+
+    return _json_response({"data": menu.menus, "message": "Successfully fetched menu"})
+
+
+@require_GET
+@cache_page(60 * 5)
+async def get_dining_bundle(request):
+    """Get all dining locations, events, and each location's menu in a single response."""
+    place_id = request.GET.get("place_id", "1007")
+    menu_id = request.GET.get("menu_id")
+
+    if not menu_id:
+        return _json_response({"error": "menu_id is required"}, status=400)
+
+    try:
+        locations, events = await asyncio.gather(dining_api.get_locations(), dining_api.get_events(place_id))
+    except APIException as e:
+        return _json_response({"detail": str(e.detail)}, status=e.status_code)
+    location_list = locations.get("locations", {}).get("location", [])
 
-    return Response({"data": menu.get("menus", []), "message": "Successfully fetched menu"})
+    menus = await asyncio.gather(
+        *(dining_api.get_menu(location["dbid"], menu_id) for location in location_list),
+        return_exceptions=True,
+    )
+    menus_by_location = {}
+    for location, menu in zip(location_list, menus, strict=True):
+        if isinstance(menu, Exception):
+            logger.warning(f"Skipping menu for location {location['dbid']} in dining bundle: {menu}")
+            continue
+        menus_by_location[location["dbid"]] = menu.menus
+
+    bundle = {
+        "locations": location_list,
+        "events_by_place": {place_id: events.get("events", [])},
+        "menus_by_location": menus_by_location,
+    }
+    return _json_response({"data": bundle, "message": "Successfully fetched dining bundle"})
+
+
+if __name__ == "__main__":
+    _test_dining_locations()
+    _test_get_events()
+    asyncio.run(_test_dining_apis())
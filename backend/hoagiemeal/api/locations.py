@@ -15,20 +15,21 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
+from typing import ClassVar
+
 import msgspec.json as msj
 
-from student_app import StudentApp
-from hoagiemeal.logger import logger
+from hoagiemeal.api.student_app import StudentApp
+from hoagiemeal.utils.logger import logger
 
 
 class Locations(StudentApp):
     """Fetch the name and ID of a location provided a home/office address."""
 
-    def __init__(self):
-        super().__init__()
-        self.LOCATIONS = "/locations/search"
+    LOCATIONS: ClassVar[str] = "/locations/search"
 
-    def get_location(self, office: str) -> dict:
+    async def get_location(self, office: str) -> dict:
         """Fetch the name and ID of a location provided an address.
 
         Args:
@@ -48,7 +49,7 @@ class Locations(StudentApp):
 
         """
         params = {"office": office}
-        return self._make_request(self.LOCATIONS, params=params)
+        return await self._make_request(self.LOCATIONS, params=params)
 
 
 def _test_locations():
@@ -56,7 +57,7 @@ def _test_locations():
     office_address = "45 Stanworth Apartments"
 
     try:
-        result = locations.get_location(office=office_address)
+        result = asyncio.run(locations.get_location(office=office_address))
         result = msj.format(result, indent=0)
         logger.info(f"Location fetched: {result}")
 
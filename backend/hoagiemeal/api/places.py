@@ -15,20 +15,21 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
+from typing import ClassVar
+
 import msgspec.json as msj
 
-from student_app import StudentApp
-from hoagiemeal.logger import logger
+from hoagiemeal.api.student_app import StudentApp
+from hoagiemeal.utils.logger import logger
 
 
 class Places(StudentApp):
     """Fetches availability of various campus venues."""
 
-    def __init__(self):
-        super().__init__()
-        self.PLACES_OPEN = "/places/open"
+    PLACES_OPEN: ClassVar[str] = "/places/open"
 
-    def get_open_places(self) -> dict:
+    async def get_open_places(self) -> dict:
         """Retrieve a list of venues in a category (default: all dining venues)
         with their current open status.
 
@@ -45,14 +46,14 @@ class Places(StudentApp):
             }]
 
         """
-        return self._make_request(self.PLACES_OPEN)  # JSON-only endpoint.
+        return await self._make_request(self.PLACES_OPEN)  # JSON-only endpoint.
 
 
 def _test_places_open(formatted: bool = True):
     places = Places()
     logger.debug("Testing: Get Open Places...")
     try:
-        open_places = places.get_open_places()
+        open_places = asyncio.run(places.get_open_places())
         open_places = msj.decode(open_places)
         logger.info(f"Open Places fetched. Total places received: {len(open_places)}")
 
@@ -22,6 +22,10 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
+from typing import ClassVar
+
+import msgspec
 import msgspec.json as msj
 
 from hoagiemeal.utils.deprecated import deprecated
@@ -29,58 +33,138 @@ from hoagiemeal.utils.logger import logger
 from hoagiemeal.api.student_app import StudentApp
 
 
+class MenuItem(msgspec.Struct):
+    """The fields of a /dining/menu item that the backend reads.
+
+    Unknown fields are ignored when decoding, so only decode items into this where
+    typed access is needed, not when passing them on to API consumers.
+    """
+
+    id: str
+    name: str
+    description: str | None = None
+    link: str | None = None
+
+
+class MenuResponse(msgspec.Struct):
+    """The /dining/menu response body.
+
+    Items are kept as raw JSON, so they are re-encoded byte for byte with every upstream
+    field intact. Use `items` for typed access.
+    """
+
+    menus: list[msgspec.Raw] = []
+
+    def items(self) -> list[MenuItem]:
+        """Decode the menu items into `MenuItem` structs."""
+        return [_MENU_ITEM_DECODER.decode(item) for item in self.menus]
+
+
+_MENU_ITEM_DECODER = msj.Decoder(MenuItem)
+
+
+class GeoLoc(msgspec.Struct):
+    """Coordinates of a dining location."""
+
+    lat: float
+    long: float
+
+
+class Building(msgspec.Struct):
+    """The building housing a dining location."""
+
+    name: str
+    location_id: str = ""
+
+
+class Amenity(msgspec.Struct):
+    """A single amenity offered at a dining location."""
+
+    name: str
+
+
+class Amenities(msgspec.Struct):
+    """The <amenities> wrapper around a location's amenity list."""
+
+    amenity: list[Amenity] = []
+
+
+class Location(msgspec.Struct):
+    """A single location returned by the /dining/locations endpoint."""
+
+    name: str
+    mapName: str
+    dbid: str
+    geoloc: GeoLoc
+    building: Building
+    amenities: Amenities = msgspec.field(default_factory=Amenities)
+
+
 class Schemas(StudentApp):
     """Fetch XML and JSON schemas for the /courses/, /dining/, and /places/ endpoints."""
 
-    def __init__(self):
-        super().__init__()
-        self.COURSES_XSD = "/courses/xsd"
-        self.DINING_XSD = "/dining/xsd"
-        self.COURSES_JSD = "/courses/jsd"
-        self.PLACES_JSD = "/places/jsd"
+    COURSES_XSD: ClassVar[str] = "/courses/xsd"
+    DINING_XSD: ClassVar[str] = "/dining/xsd"
+    COURSES_JSD: ClassVar[str] = "/courses/jsd"
+    PLACES_JSD: ClassVar[str] = "/places/jsd"
+
+    # Schema documents are static for the lifetime of the process, so each one is
+    # fetched once and shared by every instance.
+    _cache: ClassVar[dict[str, bytes | str]] = {}
 
-    def get_courses_xsd(self, to_json: bool = False) -> dict | str:
+    async def _get_schema(self, path: str, fmt: str) -> bytes | str:
+        """Fetch a schema document, serving repeat requests from memory."""
+        if path not in self._cache:
+            self._cache[path] = await self._make_request(path, fmt=fmt)
+        return self._cache[path]
+
+    async def get_courses_xsd(self, to_json: bool = False) -> dict | bytes:
         """Fetch the XSD schema for courses."""
-        response = self._make_request(self.COURSES_XSD, fmt="xml")
+        response = await self._get_schema(self.COURSES_XSD, fmt="xml")
         if to_json:
             response = self._parse_xml(response)
         return response
 
-    def get_dining_xsd(self, to_json: bool = False) -> dict | str:
+    async def get_dining_xsd(self, to_json: bool = False) -> dict | bytes:
         """Fetch the XSD schema for dining."""
-        response = self._make_request(self.DINING_XSD, fmt="xml")
+        response = await self._get_schema(self.DINING_XSD, fmt="xml")
         if to_json:
             response = self._parse_xml(response)
         return response
 
-    def get_courses_jsd(self) -> dict:
+    async def get_courses_jsd(self) -> dict:
         """Fetch the JSON schema for courses."""
-        response = self._make_request(self.COURSES_JSD, fmt="json")
+        response = await self._get_schema(self.COURSES_JSD, fmt="json")
         return response
 
-    def get_places_jsd(self) -> dict:
+    async def get_places_jsd(self) -> dict:
         """Fetch the JSON schema for places."""
-        response = self._make_request(self.PLACES_JSD, fmt="json")
+        response = await self._get_schema(self.PLACES_JSD, fmt="json")
         return response
 
+
+# Shared instance, so callers reuse one client instead of constructing their own.
+schemas_api = Schemas()
+
+
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_courses_xsd(to_json: bool = False):
     logger.debug("Testing courses XSD schema.")
     schemas = Schemas()
-    result = schemas.get_courses_xsd()
+    result = asyncio.run(schemas.get_courses_xsd())
     logger.info(f"Courses XSD: {result}")
 
 def _test_dining_xsd(to_json: bool = False):
     logger.debug("Testing dining XSD schema.")
     schemas = Schemas()
-    result = schemas.get_dining_xsd()
+    result = asyncio.run(schemas.get_dining_xsd())
     logger.info(f"Dining XSD: {result}")
 
 @deprecated(reason="This API is not used in the Hoagie Meal app.")
 def _test_courses_jsd(formatted: bool = True):
     logger.debug("Testing courses JSD schema.")
     schemas = Schemas()
-    response = schemas.get_courses_jsd()
+    response = asyncio.run(schemas.get_courses_jsd())
     if formatted:
         response = msj.format(response, indent=0)
     logger.info(f"Courses JSD: {response}")
@@ -88,7 +172,7 @@ def _test_courses_jsd(formatted: bool = True):
 def _test_places_jsd(formatted: bool = True):
     logger.debug("Testing places JSD schema.")
     schemas = Schemas()
-    response = schemas.get_places_jsd()
+    response = asyncio.run(schemas.get_places_jsd())
     if formatted:
         response = msj.format(response, indent=0)
     logger.info(f"Places JSD: {response}")
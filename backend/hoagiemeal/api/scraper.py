@@ -15,112 +15,286 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import re
 import requests
 import pprint
-from bs4 import BeautifulSoup
-from copy import deepcopy
-from hoagiemeal.logger import logger
-
-
-class Scraper:
-    """Web scraper for extracting and structuring menu item information.
-
-    Attributes:
-        INGREDIENTS_CLASS (str): CSS class used to locate ingredient elements in HTML.
-        ALLERGENS_CLASS (str): CSS class used to locate allergen elements in HTML.
-        CALORIES_SIZE_ID (str): HTML ID used to locate calorie and serving size elements.
-        NUTRITION_ID (str): HTML ID used to locate nutrition facts.
-        NAME_QUERY (str): HTML tag used to locate the menu item name.
-        EMPTY_MENU_SCHEMA (dict): A default schema for structured menu information, 
-                                  including "Name", "Serving Size", "Calories", 
-                                  "Calories from Fat", and detailed nutritional sections 
-                                  for "Fat", "Carbohydrates", "Protein", and "Vitamins".
-
+import aiohttp
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import ClassVar
+from django.conf import settings
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+from urllib.parse import urlparse
+from hoagiemeal.utils.logger import logger
+from hoagiemeal.api.student_app import RateLimiter
+
+MAX_CONCURRENT_FETCHES = 50
+MAX_CONCURRENT_FETCHES_PER_HOST = 4
+USER_AGENT = "HoagieMeal/1.0 (+https://hoagie.io)"
+STREAM_CHUNK_SIZE = 8192
+
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _build_session() -> requests.Session:
+    """Build the pooled, retrying HTTP session shared by every Scraper."""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across Scraper instances so sequential get_html calls reuse keep-alive
+# connections to menus.princeton.edu.
+_session = _build_session()
+
+_has_digit = re.compile(r"\d").search
+_split_list = re.compile(r"\s*,\s*").split
+
+# (index into the nutrition facts elements, label prefix to strip, path into the schema)
+NUTRITION_FIELDS = (
+    (0, "Total Fat", ("Fat", "Total Fat", "Amount")),
+    (1, "", ("Fat", "Total Fat", "Daily Value")),
+    (2, "Tot. Carb.", ("Carbohydrates", "Total Carbohydrates", "Amount")),
+    (3, "", ("Carbohydrates", "Total Carbohydrates", "Daily Value")),
+    (4, "Sat. Fat", ("Fat", "Saturated Fat", "Amount")),
+    (5, "", ("Fat", "Saturated Fat", "Daily Value")),
+    (6, "Dietary Fiber", ("Carbohydrates", "Dietary Fiber", "Amount")),
+    (7, "", ("Carbohydrates", "Dietary Fiber", "Daily Value")),
+    (8, "Trans Fat", ("Fat", "Trans Fat", "Amount")),
+    (9, "", ("Fat", "Trans Fat", "Daily Value")),
+    (10, "Sugars", ("Carbohydrates", "Sugar", "Amount")),
+    (11, "", ("Carbohydrates", "Sugar", "Daily Value")),
+    (12, "Cholesterol", ("Cholesterol", "Amount")),
+    (13, "", ("Cholesterol", "Daily Value")),
+    (14, "Protein", ("Protein", "Amount")),
+    (15, "", ("Protein", "Daily Value")),
+    (16, "Sodium", ("Sodium", "Amount")),
+    (17, "", ("Sodium", "Daily Value")),
+)
+
+# Vitamins in the order their daily values are listed on a label page.
+VITAMIN_FIELDS = ("Vitamin D", "Potassium", "Calcium", "Iron")
+
+
+class HostRateLimiter(RateLimiter):
+    """Token bucket that paces requests to a single scraped host at 5 requests per second."""
+
+    RATE = 5
+    MAX_TOKENS = 5
+
+
+def _new_schema() -> dict:
+    """Return a fresh, empty menu item schema.
+
+    Built as a literal on every call, which is far cheaper than deep-copying a template.
     """
-
-    def __init__(self):
-        """Initialize the Scraper with HTML selectors and an empty schema template."""
-        self.INGREDIENTS_CLASS = "labelingredientsvalue"
-        self.ALLERGENS_CLASS = "labelallergensvalue"
-        self.CALORIES_SIZE_ID = "facts2"
-        self.NUTRITION_ID = "facts4"
-        self.NAME_QUERY = "h2"
-        self.EMPTY_MENU_SCHEMA = {
-            "Name": "",
-            "Serving Size": "",
-            "Calories": "",
-            "Calories from Fat": "",
-            "Ingredients": [],
-            "Allergens": [],
-            "Fat": {
-                "Total Fat": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Saturated Fat": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Trans Fat": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
+    return {
+        "Name": "",
+        "Serving Size": "",
+        "Calories": "",
+        "Calories from Fat": "",
+        "Ingredients": [],
+        "Allergens": [],
+        "Fat": {
+            "Total Fat": {
+                "Amount": "",
+                "Daily Value": "",
+            },
+            "Saturated Fat": {
+                "Amount": "",
+                "Daily Value": "",
+            },
+            "Trans Fat": {
+                "Amount": "",
+                "Daily Value": "",
+            },
+        },
+        "Cholesterol": {
+            "Amount": "",
+            "Daily Value": "",
+        },
+        "Sodium": {
+            "Amount": "",
+            "Daily Value": "",
+        },
+        "Carbohydrates": {
+            "Total Carbohydrates": {
+                "Amount": "",
+                "Daily Value": "",
             },
-            "Cholesterol": {
+            "Dietary Fiber": {
                 "Amount": "",
                 "Daily Value": "",
             },
-            "Sodium": {
+            "Sugar": {
                 "Amount": "",
                 "Daily Value": "",
             },
-            "Carbohydrates": {
-                "Total Carbohydrates": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Dietary Fiber": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Sugar": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
+        },
+        "Protein": {
+            "Amount": "",
+            "Daily Value": "",
+        },
+        "Vitamins": {
+            "Vitamin D": {
+                "Amount": "",
+                "Daily Value": "",
+            },
+            "Calcium": {
+                "Amount": "",
+                "Daily Value": "",
             },
-            "Protein": {
+            "Iron": {
                 "Amount": "",
                 "Daily Value": "",
             },
-            "Vitamins": {
-                "Vitamin D": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Calcium": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Iron": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
-                "Potassium": {
-                    "Amount": "",
-                    "Daily Value": "",
-                },
+            "Potassium": {
+                "Amount": "",
+                "Daily Value": "",
             },
-        }
+        },
+    }
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    """Return the validator metadata and body paths used to cache a URL on disk."""
+    key = hashlib.sha256(url.encode()).hexdigest()
+    cache_dir = settings.SCRAPER_CACHE_DIR
+    return cache_dir / f"{key}.json", cache_dir / f"{key}.html"
+
+
+def _conditional_headers(url: str) -> dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from a previously cached response."""
+    meta_path, body_path = _cache_paths(url)
+    if not body_path.exists():
+        return {}
+    try:
+        meta = json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _read_cached_body(url: str) -> bytes | None:
+    """Return the cached body for a URL, or None if it is not cached."""
+    try:
+        return _cache_paths(url)[1].read_bytes()
+    except OSError:
+        return None
+
+
+def _store_response(url: str, headers: Mapping[str, str], body: bytes) -> None:
+    """Cache a response body on disk if the server sent validators for revalidating it."""
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    meta_path, body_path = _cache_paths(url)
+    try:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps({"etag": etag, "last_modified": last_modified}))
+    except OSError as e:
+        logger.error("Could not cache response for %s: %s", url, e)
+
+
+def _parse_html(content: bytes) -> html.HtmlElement:
+    """Parse raw HTML bytes into an lxml element tree."""
+    return html.fromstring(content)
+
 
-    def get_html(self, link: str = None) -> BeautifulSoup | None:
+class Scraper:
+    """Web scraper for extracting and structuring menu item information.
+
+    Attributes:
+        INGREDIENTS_CLASS (str): CSS class used to locate ingredient elements in HTML.
+        ALLERGENS_CLASS (str): CSS class used to locate allergen elements in HTML.
+        CALORIES_SIZE_ID (str): HTML ID used to locate calorie and serving size elements.
+        NUTRITION_ID (str): HTML ID used to locate nutrition facts.
+        NAME_QUERY (str): HTML tag used to locate the menu item name.
+
+    """
+
+    INGREDIENTS_CLASS: ClassVar[str] = "labelingredientsvalue"
+    ALLERGENS_CLASS: ClassVar[str] = "labelallergensvalue"
+    CALORIES_SIZE_ID: ClassVar[str] = "facts2"
+    NUTRITION_ID: ClassVar[str] = "facts4"
+    NAME_QUERY: ClassVar[str] = "h2"
+    # One union query returns every node get_info needs, in document order, so the
+    # tree is walked once per page instead of once per field.
+    _xp: ClassVar[etree.XPath] = etree.XPath(
+        f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {INGREDIENTS_CLASS} ')]"
+        f" | //*[contains(concat(' ', normalize-space(@class), ' '), ' {ALLERGENS_CLASS} ')]"
+        f" | //{NAME_QUERY} | //*[@id='{CALORIES_SIZE_ID}'] | //*[@id='{NUTRITION_ID}'] | //li"
+    )
+    # How many nodes of each kind a complete label page has; once all have been
+    # parsed, get_html can stop reading the rest of the page.
+    _expected_counts: ClassVar[dict[str, int]] = {
+        INGREDIENTS_CLASS: 1,
+        ALLERGENS_CLASS: 1,
+        NAME_QUERY: 1,
+        CALORIES_SIZE_ID: 3,
+        NUTRITION_ID: len(NUTRITION_FIELDS),
+        "li": len(VITAMIN_FIELDS),
+    }
+
+    def _stream_parse(self, link: str, response: requests.Response) -> html.HtmlElement:
+        """Parse a streamed response incrementally as its chunks arrive.
+
+        Uncacheable pages stop being parsed as soon as every node `get_info` reads has been
+        seen. The rest of the body is still read, so the keep-alive connection can go back to
+        the pool. Pages with validators are parsed in full and stored for revalidation.
+        """
+        cacheable = "ETag" in response.headers or "Last-Modified" in response.headers
+        parser = etree.HTMLPullParser(events=("end",))
+        parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        remaining = dict(self._expected_counts)
+        parsing = True
+        chunks = []
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            if cacheable:
+                chunks.append(chunk)
+            if not parsing:
+                continue
+            parser.feed(chunk)
+            for _, node in parser.read_events():
+                for key in self._node_keys(node):
+                    remaining[key] -= 1
+            parsing = cacheable or any(count > 0 for count in remaining.values())
+        if cacheable:
+            _store_response(link, response.headers, b"".join(chunks))
+        return parser.close()
+
+    def get_html(self, link: str = None) -> html.HtmlElement | None:
         """Fetch and parse HTML content from the specified URL.
 
+        Responses that carry an ETag or Last-Modified header are cached on disk, and later
+        calls revalidate them with a conditional GET so unchanged pages come back as 304s.
+
         Args:
             link (str): The URL to fetch HTML content from. If None or empty, 
                         logs an error and returns None.
 
         Returns:
-            BeautifulSoup: Parsed HTML content as a BeautifulSoup object if the request 
+            html.HtmlElement: Parsed HTML content as an lxml element tree if the request
                         is successful. Returns None if no link is provided or if an 
                         exception occurs during fetching.
 
@@ -130,23 +304,163 @@ class Scraper:
             logger.error("Exception occurred: No link provided.")
             return None
         try:
-            response = requests.get(link, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "lxml")
-            logger.info("HTML content fetched successfully.")
-            return soup
+            # A 304 whose cached body has since gone missing is refetched without validators.
+            for headers in (_conditional_headers(link), {}):
+                with _session.get(link, timeout=10, headers=headers, stream=True) as response:
+                    if response.status_code == 304:
+                        content = _read_cached_body(link)
+                        if content is None:
+                            logger.warning("Cached body for %s is missing; refetching it.", link)
+                            continue
+                        tree = _parse_html(content)
+                    else:
+                        response.raise_for_status()
+                        tree = self._stream_parse(link, response)
+                logger.info("HTML content fetched successfully.")
+                return tree
+            return None
         except requests.RequestException as e:
-            logger.error(f"Network error: {e}")
+            logger.error("Network error: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error fetching HTML content: {e}")
+            logger.error("Unexpected error fetching HTML content: %s", e, exc_info=True)
+            return None
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        host_sems: dict[str, asyncio.Semaphore],
+        host_limits: dict[str, HostRateLimiter],
+        url: str,
+    ) -> bytes | None:
+        """Fetch the raw body of a single URL, returning None on failure.
+
+        Requests are capped both globally by `semaphore` and per host by `host_sems` and
+        `host_limits`, so that a batch aimed at one server stays within its concurrency
+        and rate limits. The on-disk cache is read and written in worker threads, so the
+        loop is never blocked on disk I/O.
+        """
+        host = urlparse(url).netloc
+        async with semaphore, host_sems[host]:
+            try:
+                conditional_headers = await asyncio.to_thread(_conditional_headers, url)
+                # A 304 whose cached body has since gone missing is refetched without validators.
+                for headers in (conditional_headers, {}):
+                    await host_limits[host].wait_for_token()
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10), headers=headers) as response:
+                        if response.status == 304:
+                            content = await asyncio.to_thread(_read_cached_body, url)
+                            if content is None:
+                                logger.warning("Cached body for %s is missing; refetching it.", url)
+                                continue
+                            return content
+                        response.raise_for_status()
+                        content = await response.read()
+                    await asyncio.to_thread(_store_response, url, response.headers, content)
+                    return content
+            except aiohttp.ClientError as e:
+                logger.error("Network error fetching %s: %s", url, e)
+            except asyncio.TimeoutError:
+                logger.error("Timed out fetching %s", url)
             return None
 
-    def get_info(self, soup: BeautifulSoup = None) -> dict:
+    async def _fetch_many(self, links: list[str]) -> list[bytes | None]:
+        """Fetch the raw bodies of many URLs concurrently over one session.
+
+        The semaphores and rate limiters are created per batch: asyncio primitives bind to
+        the loop they are first used in, and callers may run each batch in a new loop.
+        """
+        logger.info("Fetching HTML content for %s links.", len(links))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        host_sems = defaultdict(lambda: asyncio.Semaphore(MAX_CONCURRENT_FETCHES_PER_HOST))
+        host_limits = defaultdict(HostRateLimiter)
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_FETCHES, limit_per_host=MAX_CONCURRENT_FETCHES_PER_HOST, ttl_dns_cache=300
+        )
+        async with aiohttp.ClientSession(connector=connector, headers={"User-Agent": USER_AGENT}) as session:
+            return await asyncio.gather(
+                *(
+                    self._fetch(session, semaphore, host_sems, host_limits, link) if link else asyncio.sleep(0)
+                    for link in links
+                )
+            )
+
+    async def get_html_many(self, links: list[str]) -> list[html.HtmlElement | None]:
+        """Fetch and parse HTML content from many URLs concurrently.
+
+        Args:
+            links (list[str]): The URLs to fetch HTML content from.
+
+        Returns:
+            list[html.HtmlElement | None]: Parsed HTML content for each link, in the same order
+                as `links`. Entries are None for empty links or failed requests.
+
+        """
+        contents = await self._fetch_many(links)
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            *(loop.run_in_executor(None, _parse_html, content) if content else asyncio.sleep(0) for content in contents)
+        )
+
+    async def scrape_many(self, links: list[str]) -> list[dict]:
+        """Fetch many label pages concurrently and extract their menu item information.
+
+        Pages are parsed in parallel across a shared process pool. Identical bodies are
+        extracted once per batch, and each worker memoizes extraction on the page body, so
+        pages unchanged since an earlier scrape (including 304 revalidations) are usually
+        not parsed again.
+
+        Args:
+            links (list[str]): The label page URLs to scrape.
+
+        Returns:
+            list[dict]: Menu item information for each link, in the same order as `links`,
+                in the format returned by `get_info`. The dictionaries may be shared with
+                the cache and must not be mutated.
+
+        """
+        contents = await self._fetch_many(links)
+        unique_contents = list(dict.fromkeys(contents))
+        loop = asyncio.get_running_loop()
+        pool = _get_parse_pool()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _extract, content) for content in unique_contents)
+        )
+        info_by_content = dict(zip(unique_contents, results, strict=True))
+        return [info_by_content[content] for content in contents]
+
+    @classmethod
+    def _node_keys(cls, node: html.HtmlElement) -> list[str]:
+        """Return the selectors in `_expected_counts` that a node satisfies."""
+        keys = []
+        classes = node.get("class", "").split()
+        if cls.INGREDIENTS_CLASS in classes:
+            keys.append(cls.INGREDIENTS_CLASS)
+        if cls.ALLERGENS_CLASS in classes:
+            keys.append(cls.ALLERGENS_CLASS)
+        if node.tag in (cls.NAME_QUERY, "li"):
+            keys.append(node.tag)
+        node_id = node.get("id")
+        if node_id in (cls.CALORIES_SIZE_ID, cls.NUTRITION_ID):
+            keys.append(node_id)
+        return keys
+
+    @classmethod
+    def _select_nodes(cls, tree: html.HtmlElement) -> dict[str, list[html.HtmlElement]]:
+        """Run the combined selector once and bucket the matches by the selector they satisfy."""
+        nodes = defaultdict(list)
+        for node in cls._xp(tree):
+            for key in cls._node_keys(node):
+                nodes[key].append(node)
+        return nodes
+
+    @classmethod
+    def get_info(cls, tree: html.HtmlElement = None) -> dict:
         """Extract menu item information.
 
         Args:
-            soup (BeautifulSoup): Parsed HTML content containing menu item data. If None 
+            tree (html.HtmlElement): Parsed HTML content containing menu item data. If None
                 or invalid, an empty schema is returned.
 
         Returns:
@@ -168,219 +482,114 @@ class Scraper:
                     - "Vitamin D", "Potassium", "Calcium", "Iron")
 
         """
-        if soup is None or not isinstance(soup, BeautifulSoup):
-            logger.error("Exception occurred: No soup object found.")
-            response = deepcopy(self.EMPTY_MENU_SCHEMA)
+        if tree is None or not isinstance(tree, html.HtmlElement):
+            logger.error("Exception occurred: No HTML tree found.")
+            response = _new_schema()
             return response
         try:
-            response = deepcopy(self.EMPTY_MENU_SCHEMA)
-            try:
-                ingredients_element = soup.find_all(class_=self.INGREDIENTS_CLASS)[0]
-                ingredients_parsed = ingredients_element.get_text().split(",")
-                ingredients_list = [item.strip().capitalize() for item in ingredients_parsed]
+            response = _new_schema()
+            nodes = cls._select_nodes(tree)
+            if ingredients_elements := nodes[cls.INGREDIENTS_CLASS]:
+                ingredients_parsed = _split_list(ingredients_elements[0].text_content().strip())
+                ingredients_list = [item.capitalize() for item in ingredients_parsed]
                 response["Ingredients"] = ingredients_list or []
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
+            else:
+                logger.warning("Label page has no ingredients.")
 
-            try:
-                allergens_element = soup.find_all(class_=self.ALLERGENS_CLASS)[0]
-                allergens_text = allergens_element.get_text().strip()
-                allergen_text_truncated = (
-                    allergens_text[len("Ingredients include") :]
-                    if allergens_text.startswith("Ingredients include")
-                    else allergens_text
-                )
-                allergens_list = [allergen.strip().capitalize() for allergen in allergen_text_truncated.split(",")]
+            if allergens_elements := nodes[cls.ALLERGENS_CLASS]:
+                allergens_text = allergens_elements[0].text_content().strip()
+                allergen_text_truncated = allergens_text.removeprefix("Ingredients include")
+                allergens_list = [allergen.capitalize() for allergen in _split_list(allergen_text_truncated.strip())]
                 response["Allergens"] = allergens_list or []
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
+            else:
+                logger.warning("Label page has no allergens.")
 
-            try:
-                name_element = soup.find_all(self.NAME_QUERY)[0]
-                name_text = name_element.get_text().strip()
+            if name_elements := nodes[cls.NAME_QUERY]:
+                name_text = name_elements[0].text_content().strip()
                 response["Name"] = name_text or ""
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
-
-            try:
-                elements = soup.find_all(id=self.CALORIES_SIZE_ID)
-                serving_size_element = elements[0]
-                serving_size_text = serving_size_element.text.strip()[len("Serving Size") :].strip()
-                response["Serving Size"] = serving_size_text if any(chr.isdigit() for chr in serving_size_text) else ""
-
-                calories_element = elements[1]
-                calories_text = calories_element.text.strip()[len("Calories") :].strip()
-                calories_text = calories_text if calories_text.isnumeric() else ""
-                response["Calories"] = calories_text if any(chr.isdigit() for chr in calories_text) else ""
-
-                fat_calories_element = elements[2]
-                fat_calories_text = fat_calories_element.text.strip()[len("Calories from Fat") :].strip()
-                fat_calories_text = fat_calories_text if fat_calories_text.isnumeric() else ""
-                response["Calories from Fat"] = (
-                    fat_calories_text if any(chr.isdigit() for chr in fat_calories_text) else ""
-                )
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
-
-            try:
-                nutrition_elements = soup.find_all(id=self.NUTRITION_ID) or []
-                total_fat_amount_element = nutrition_elements[0]
-                total_fat_amount_text = total_fat_amount_element.text.strip()[len("Total Fat") :].strip()
-                response["Fat"]["Total Fat"]["Amount"] = (
-                    total_fat_amount_text if any(chr.isdigit() for chr in total_fat_amount_text) else ""
-                )
-
-                total_fat_dv_element = nutrition_elements[1]
-                total_fat_dv_text = total_fat_dv_element.text.strip()
-                response["Fat"]["Total Fat"]["Daily Value"] = (
-                    total_fat_dv_text if any(chr.isdigit() for chr in total_fat_dv_text) else ""
-                )
-
-                total_carb_amount_element = nutrition_elements[2]
-                total_carb_amount_text = total_carb_amount_element.text.strip()[len("Tot. Carb.") :].strip()
-                response["Carbohydrates"]["Total Carbohydrates"]["Amount"] = (
-                    total_carb_amount_text if any(chr.isdigit() for chr in total_carb_amount_text) else ""
-                )
-
-                total_carb_dv_element = nutrition_elements[3]
-                total_carb_dv_text = total_carb_dv_element.text.strip()
-                response["Carbohydrates"]["Total Carbohydrates"]["Daily Value"] = (
-                    total_carb_dv_text if any(chr.isdigit() for chr in total_carb_dv_text) else ""
-                )
-
-                sat_fat_amount_element = nutrition_elements[4]
-                sat_fat_amount_text = sat_fat_amount_element.text.strip()[len("Sat. Fat") :].strip()
-                response["Fat"]["Saturated Fat"]["Amount"] = (
-                    sat_fat_amount_text if any(chr.isdigit() for chr in sat_fat_amount_text) else ""
-                )
-
-                sat_fat_dv_element = nutrition_elements[5]
-                sat_fat_dv_text = sat_fat_dv_element.text.strip()
-                response["Fat"]["Saturated Fat"]["Daily Value"] = (
-                    sat_fat_dv_text if any(chr.isdigit() for chr in sat_fat_dv_text) else ""
-                )
-
-                fiber_amount_element = nutrition_elements[6]
-                fiber_amount_text = fiber_amount_element.text.strip()[len("Dietary Fiber") :].strip()
-                response["Carbohydrates"]["Dietary Fiber"]["Amount"] = (
-                    fiber_amount_text if any(chr.isdigit() for chr in fiber_amount_text) else ""
-                )
-
-                fiber_dv_element = nutrition_elements[7]
-                fiber_dv_text = fiber_dv_element.text.strip()
-                response["Carbohydrates"]["Dietary Fiber"]["Daily Value"] = (
-                    fiber_dv_text if any(chr.isdigit() for chr in fiber_dv_text) else ""
-                )
-
-                trans_fat_amount_element = nutrition_elements[8]
-                trans_fat_amount_text = trans_fat_amount_element.text.strip()[len("Trans Fat") :].strip()
-                response["Fat"]["Trans Fat"]["Amount"] = (
-                    trans_fat_amount_text if any(chr.isdigit() for chr in trans_fat_amount_text) else ""
-                )
+            else:
+                logger.warning("Label page has no name.")
+
+            elements = nodes[cls.CALORIES_SIZE_ID]
+            if len(elements) < 3:
+                logger.warning("Label page has %s of 3 serving size and calorie facts.", len(elements))
+            if len(elements) > 0:
+                serving_size_text = elements[0].text_content().strip().removeprefix("Serving Size").strip()
+                response["Serving Size"] = serving_size_text if _has_digit(serving_size_text) else ""
+            if len(elements) > 1:
+                calories_text = elements[1].text_content().strip().removeprefix("Calories").strip()
+                response["Calories"] = calories_text if calories_text.isnumeric() else ""
+            if len(elements) > 2:
+                fat_calories_text = elements[2].text_content().strip().removeprefix("Calories from Fat").strip()
+                response["Calories from Fat"] = fat_calories_text if fat_calories_text.isnumeric() else ""
+
+            nutrition_elements = nodes[cls.NUTRITION_ID]
+            if len(nutrition_elements) < len(NUTRITION_FIELDS):
+                logger.warning("Label page has %s of %s nutrition facts.", len(nutrition_elements), len(NUTRITION_FIELDS))
+            for index, prefix, path in NUTRITION_FIELDS[: len(nutrition_elements)]:
+                text = nutrition_elements[index].text_content().strip().removeprefix(prefix).strip()
+                section = response
+                for key in path[:-1]:
+                    section = section[key]
+                section[path[-1]] = text if _has_digit(text) else ""
+
+            vitamin_elements = nodes["li"]
+            if len(vitamin_elements) < len(VITAMIN_FIELDS):
+                logger.warning("Label page has %s of %s vitamin facts.", len(vitamin_elements), len(VITAMIN_FIELDS))
+            for vitamin, element in zip(VITAMIN_FIELDS, vitamin_elements, strict=False):
+                span = element.find(".//span")
+                text = span.text_content().strip() if span is not None else ""
+                response["Vitamins"][vitamin]["Daily Value"] = text if _has_digit(text) else ""
 
-                trans_fat_dv_element = nutrition_elements[9]
-                trans_fat_dv_text = trans_fat_dv_element.text.strip()
-                response["Fat"]["Trans Fat"]["Daily Value"] = (
-                    trans_fat_dv_text if any(chr.isdigit() for chr in trans_fat_dv_text) else ""
-                )
-
-                sugar_amount_element = nutrition_elements[10]
-                sugar_amount_text = sugar_amount_element.text.strip()[len("Sugars") :].strip()
-                response["Carbohydrates"]["Sugar"]["Amount"] = (
-                    sugar_amount_text if any(chr.isdigit() for chr in sugar_amount_text) else ""
-                )
-
-                sugar_dv_element = nutrition_elements[11]
-                sugar_dv_text = sugar_dv_element.text.strip()
-                response["Carbohydrates"]["Sugar"]["Daily Value"] = (
-                    sugar_dv_text if any(chr.isdigit() for chr in sugar_dv_text) else ""
-                )
-
-                chol_amount_element = nutrition_elements[12]
-                chol_amount_text = chol_amount_element.text.strip()[len("Cholesterol") :].strip()
-                response["Cholesterol"]["Amount"] = (
-                    chol_amount_text if any(chr.isdigit() for chr in chol_amount_text) else ""
-                )
-
-                chol_dv_element = nutrition_elements[13]
-                chol_dv_text = chol_dv_element.text.strip()
-                response["Cholesterol"]["Daily Value"] = (
-                    chol_dv_text if any(chr.isdigit() for chr in chol_dv_text) else ""
-                )
-
-                protein_amount_element = nutrition_elements[14]
-                protein_amount_text = protein_amount_element.text.strip()[len("Protein") :].strip()
-                response["Protein"]["Amount"] = (
-                    protein_amount_text if any(chr.isdigit() for chr in protein_amount_text) else ""
-                )
-
-                protein_dv_element = nutrition_elements[15]
-                protein_dv_text = protein_dv_element.text.strip()
-                response["Protein"]["Daily Value"] = (
-                    protein_dv_text if any(chr.isdigit() for chr in protein_dv_text) else ""
-                )
-
-                sodium_amount_element = nutrition_elements[16]
-                sodium_amount_text = sodium_amount_element.text.strip()[len("Sodium") :].strip()
-                response["Sodium"]["Amount"] = (
-                    sodium_amount_text if any(chr.isdigit() for chr in sodium_amount_text) else ""
-                )
-
-                sodium_dv_element = nutrition_elements[17]
-                sodium_dv_text = sodium_dv_element.text.strip()
-                response["Sodium"]["Daily Value"] = (
-                    sodium_dv_text if any(chr.isdigit() for chr in sodium_dv_text) else ""
-                )
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
+            return response
+        except Exception as e:
+            logger.error("Exception occurred: %s", e, exc_info=True)
+            response = _new_schema()
+            return response
 
-            try:
-                elements = soup.find_all("li")
-                vitamin_d_dv_element = elements[0]
-                vitamin_d_dv_sub_element = vitamin_d_dv_element.find("span")
-                vitamin_d_dv_text = vitamin_d_dv_sub_element.get_text().strip()
-                response["Vitamins"]["Vitamin D"]["Daily Value"] = (
-                    vitamin_d_dv_text if any(chr.isdigit() for chr in vitamin_d_dv_text) else ""
-                )
 
-                potassium_dv_element = elements[1]
-                potassium_dv_sub_element = potassium_dv_element.find("span")
-                potassium_dv_text = potassium_dv_sub_element.get_text().strip()
-                response["Vitamins"]["Potassium"]["Daily Value"] = (
-                    potassium_dv_text if any(chr.isdigit() for chr in potassium_dv_text) else ""
-                )
+@functools.lru_cache(maxsize=256)
+def _extract(content: bytes | None) -> dict:
+    """Parse a label page body and extract its menu item information.
 
-                calcium_dv_element = elements[2]
-                calcium_dv_sub_element = calcium_dv_element.find("span")
-                calcium_dv_text = calcium_dv_sub_element.get_text().strip()
-                response["Vitamins"]["Calcium"]["Daily Value"] = (
-                    calcium_dv_text if any(chr.isdigit() for chr in calcium_dv_text) else ""
-                )
+    Memoized on the raw body, so an unchanged page is only parsed once. The returned
+    dictionary is shared between callers and must not be mutated.
+    """
+    try:
+        tree = _parse_html(content) if content else None
+    except etree.ParserError as e:
+        logger.error("Exception occurred: %s", e)
+        tree = None
+    return Scraper.get_info(tree)
 
-                iron_dv_element = elements[3]
-                iron_dv_sub_element = iron_dv_element.find("span")
-                iron_dv_text = iron_dv_sub_element.get_text().strip()
-                response["Vitamins"]["Iron"]["Daily Value"] = (
-                    iron_dv_text if any(chr.isdigit() for chr in iron_dv_text) else ""
-                )
-            except Exception as e:
-                logger.error(f"Exception occurred: {e}")
 
-            return response
-        except Exception as e:
-            logger.error(f"Exception occurred: {e}")
-            response = deepcopy(self.EMPTY_MENU_SCHEMA)
-            return response
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used to extract label pages, creating it lazily."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
 
 
 def _test_scraper():
     """Test the dining hall menus scraper."""
     link = "https://menus.princeton.edu/dining/_Foodpro/online-menu/label.asp?RecNumAndPort=390047"
     scraper = Scraper()
-    soup = scraper.get_html(link=link)
-    info = scraper.get_info(soup=soup)
+    tree = scraper.get_html(link=link)
+    info = scraper.get_info(tree=tree)
     pprint.pprint(info)
 
 
+def _test_scraper_many():
+    """Test fetching several dining hall menu labels concurrently."""
+    links = [
+        "https://menus.princeton.edu/dining/_Foodpro/online-menu/label.asp?RecNumAndPort=390047",
+        "https://menus.princeton.edu/dining/_Foodpro/online-menu/label.asp?RecNumAndPort=390048",
+    ]
+    scraper = Scraper()
+    for info in asyncio.run(scraper.scrape_many(links)):
+        pprint.pprint(info)
+
+
 if __name__ == "__main__":
     _test_scraper()
@@ -20,15 +20,29 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import asyncio
 import base64
+import datetime
 import os
+import re
 import requests
-import xml.etree.ElementTree as ET
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from io import BytesIO
+from typing import ClassVar
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import aiohttp
+import msgspec
 import msgspec.json as msj
-import xmlschema
+from aiohttp_retry import ExponentialRetry, RetryClient
 from dotenv import load_dotenv
 from icalendar import Calendar
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from hoagiemeal.utils.logger import logger
 from msgspec import DecodeError
 
@@ -39,28 +53,295 @@ PRINCETON_INFO_BASE_URL = "https://api.princeton.edu:443/princeton-info/"
 STUDENT_APP_BASE_URL = "https://api.princeton.edu:443/student-app"
 WINTER_EVENTS_BASE_URL = "https://api.princeton.edu:443/winter-events/"
 REFRESH_TOKEN_URL = "https://api.princeton.edu:443/token"
+# Refresh the access token this many seconds before it actually expires.
+TOKEN_EXPIRY_MARGIN = 30
+
+
+class TokenResponse(msgspec.Struct):
+    """The /token response body."""
+
+    access_token: str
+    expires_in: int = 3600
+
+
+_TOKEN_DECODER = msj.Decoder(TokenResponse)
+
+
+class RateLimiter:
+    """Token bucket that paces requests to the Princeton OIT API.
+
+    Tokens refill continuously at RATE per second up to a burst of MAX_TOKENS,
+    and every request consumes one token before it is sent.
+    """
+
+    RATE = 10
+    MAX_TOKENS = 20
+
+    def __init__(self):
+        """Start with a full bucket."""
+        self.tokens = self.MAX_TOKENS
+        self.updated_at = time.monotonic()
+
+    async def wait_for_token(self):
+        """Wait until a token is available, then consume it."""
+        while self.tokens < 1:
+            self.add_new_tokens()
+            await asyncio.sleep(1 / self.RATE)
+        self.tokens -= 1
+
+    def add_new_tokens(self):
+        """Refill the bucket in proportion to the time elapsed since the last refill."""
+        now = time.monotonic()
+        new_tokens = (now - self.updated_at) * self.RATE
+        if self.tokens + new_tokens >= 1:
+            self.tokens = min(self.tokens + new_tokens, self.MAX_TOKENS)
+            self.updated_at = now
+
+
+# Shared across every StudentApp subclass so that concurrent requests reuse
+# pooled keep-alive connections to api.princeton.edu and stay under its rate limit.
+_limiter = RateLimiter()
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+_client: RetryClient | None = None
+# Strong references to the tasks that close each session when its loop shuts down.
+_session_closers: set[asyncio.Task] = set()
+
+
+def _build_sync_session() -> requests.Session:
+    """Build the pooled, retrying requests.Session used for synchronous token refreshes."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=None)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Token refreshes run synchronously when a StudentApp is constructed, so they use a
+# separate requests.Session that keeps its connection to the token endpoint alive.
+_sync_session = _build_sync_session()
+
+
+async def _take_limiter_token(session, trace_config_ctx, params):
+    """Consume a rate limiter token before every request the shared session sends, retries included."""
+    await _limiter.wait_for_token()
+
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    """Build the trace config that paces every request through `_limiter`."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_take_limiter_token)
+    return trace_config
+
+
+def _get_client() -> RetryClient:
+    """Return the shared retrying client, creating it lazily in the running event loop.
+
+    A ClientSession is bound to the loop it was created in, so a new one is opened
+    if the previous session was closed or belongs to a different loop. Each session
+    is closed in its own loop when that loop shuts down (see `_close_with_loop`), so
+    replacing it does not leak its connections. Requests are retried with exponential
+    backoff on 429 and 5xx responses, and every attempt waits for a `_limiter` token.
+    """
+    global _session, _session_loop, _client
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=75, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10),
+            trace_configs=[_build_trace_config()],
+        )
+        _session_loop = loop
+        closer = loop.create_task(_close_with_loop(_session))
+        _session_closers.add(closer)
+        closer.add_done_callback(_session_closers.discard)
+        _client = RetryClient(
+            client_session=_session,
+            retry_options=ExponentialRetry(attempts=3, statuses={429}, retry_all_server_errors=True),
+        )
+        logger.debug("Opened shared aiohttp ClientSession.")
+    return _client
+
+
+async def _close_with_loop(session: aiohttp.ClientSession):
+    """Wait until cancelled, then close the session.
+
+    asyncio.run (which asgiref also uses for sync-to-async calls) cancels leftover tasks
+    before closing its loop, so this closes the session while its loop can still run.
+    """
+    try:
+        await asyncio.Future()
+    finally:
+        if not session.closed:
+            await session.close()
+            logger.debug("Closed aiohttp ClientSession with its event loop.")
+
+
+async def close_session():
+    """Close the shared ClientSession, if one is open."""
+    global _session, _session_loop, _client
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.debug("Closed shared aiohttp ClientSession.")
+    _session = None
+    _session_loop = None
+    _client = None
+
+
+def close_session_at_exit():
+    """Close the shared ClientSession on interpreter shutdown, if its loop is still usable."""
+    if _session_loop is None or _session_loop.is_closed() or _session_loop.is_running():
+        return
+    _session_loop.run_until_complete(close_session())
+
+
+_ICAL_TEXT_ESCAPES = re.compile(r"\\([\\;,nN])")
+_CALENDAR_PROPERTIES = {"X-WR-CALNAME": "calname", "X-WR-TIMEZONE": "timezone", "PRODID": "prodid", "VERSION": "version"}
+_EVENT_PROPERTIES = {"SUMMARY": "summary", "DTSTART": "start", "DTEND": "end", "UID": "uid", "DESCRIPTION": "description"}
+
+
+def _unfold_ical_lines(ical_text: str) -> Iterator[str]:
+    """Yield the logical content lines of an iCal document, joining RFC 5545 folded lines."""
+    current = None
+    for line in ical_text.splitlines():
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split_ical_line(line: str) -> tuple[str, dict[str, str], str]:
+    """Split a content line into its upper-cased name, parameters, and raw value."""
+    in_quotes = False
+    for index, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:index], line[index + 1 :]
+            break
+    else:
+        head, value = line, ""
+    name, *raw_params = head.split(";")
+    params = {}
+    for param in raw_params:
+        key, _, param_value = param.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return name.upper(), params, value
+
+
+def _parse_ical_datetime(value: str, params: dict[str, str]) -> datetime.date | datetime.datetime:
+    """Parse a DATE or DATE-TIME value, honoring a trailing Z or a TZID parameter.
+
+    A TZID that is not an IANA zone name (e.g. a Windows name such as "Eastern Standard
+    Time") leaves the time floating, as icalendar does for zones it cannot resolve.
+    """
+    if len(value) == 8 or params.get("VALUE") == "DATE":
+        return datetime.datetime.strptime(value, "%Y%m%d").date()
+    if value.endswith("Z"):
+        return datetime.datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=datetime.timezone.utc)
+    parsed = datetime.datetime.strptime(value, "%Y%m%dT%H%M%S")
+    if "TZID" in params:
+        try:
+            parsed = parsed.replace(tzinfo=ZoneInfo(params["TZID"]))
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning("Unknown iCal TZID %r; treating %s as a floating time.", params["TZID"], value)
+    return parsed
+
+
+def _unescape_ical_text(value: str) -> str:
+    """Undo RFC 5545 TEXT escaping."""
+    return _ICAL_TEXT_ESCAPES.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def _scan_ical(ical_text: str) -> dict:
+    """Extract calendar and event properties from iCal text in a single pass over its lines."""
+    calendar_info = {}
+    events = []
+    components = []
+    event = None
+    for line in _unfold_ical_lines(ical_text):
+        name, params, value = _split_ical_line(line)
+        if name == "BEGIN":
+            components.append(value.upper())
+            if components[-1] == "VCALENDAR":
+                calendar_info = dict.fromkeys(_CALENDAR_PROPERTIES.values())
+            elif components[-1] == "VEVENT":
+                event = dict.fromkeys(_EVENT_PROPERTIES.values())
+        elif name == "END":
+            if components and components.pop() == "VEVENT":
+                events.append(event)
+                event = None
+        elif components and components[-1] == "VCALENDAR" and name in _CALENDAR_PROPERTIES:
+            calendar_info[_CALENDAR_PROPERTIES[name]] = _unescape_ical_text(value)
+        elif components and components[-1] == "VEVENT" and name in _EVENT_PROPERTIES:
+            if name in ("DTSTART", "DTEND"):
+                event[_EVENT_PROPERTIES[name]] = _parse_ical_datetime(value, params)
+            else:
+                event[_EVENT_PROPERTIES[name]] = _unescape_ical_text(value)
+    return {
+        "calendar_info": calendar_info,
+        "events": events,
+    }
 
 
 class StudentApp:
     """Base class for interacting with the Princeton StudentApp API."""
 
+    # The access token is shared by every instance and only refreshed when a request finds
+    # it about to expire or the API rejects it, not on construction.
+    _token_cache: ClassVar[dict] = {"value": None, "auth_header": None, "expires_at": 0.0}
+    _token_lock: ClassVar[threading.RLock] = threading.RLock()
+
     def __init__(self):
+        """Read the client credentials from the environment."""
         self.CONSUMER_KEY = os.environ.get("CONSUMER_KEY")
         self.CONSUMER_SECRET = os.environ.get("CONSUMER_SECRET")
-        self.ACCESS_TOKEN = os.environ.get("ACCESS_TOKEN")
         self.REFRESH_TOKEN_URL = REFRESH_TOKEN_URL
-        self._refresh_token(grant_type="client_credentials")
+        # The client credentials never change, so the Basic header is encoded once.
+        credentials = f"{self.CONSUMER_KEY}:{self.CONSUMER_SECRET}".encode("utf-8")
+        self._basic_auth_header = "Basic " + base64.b64encode(credentials).decode("utf-8")
+
+    @property
+    def ACCESS_TOKEN(self) -> str | None:
+        """The cached access token shared by all StudentApp instances."""
+        return StudentApp._token_cache["value"]
+
+    @staticmethod
+    def _token_expired() -> bool:
+        """Whether the shared access token is missing or about to expire."""
+        return time.time() >= StudentApp._token_cache["expires_at"] - TOKEN_EXPIRY_MARGIN
+
+    def _refresh_expired_token(self):
+        """Refresh the shared access token unless another thread already did."""
+        with StudentApp._token_lock:
+            if self._token_expired():
+                self._refresh_token(grant_type="client_credentials")
+
+    async def _ensure_token(self):
+        """Refresh the shared access token if it is missing or about to expire.
+
+        The refresh is a blocking POST, so it runs in a worker thread rather than
+        stalling every other request on the event loop.
+        """
+        if self._token_expired():
+            await asyncio.to_thread(self._refresh_expired_token)
 
     def _refresh_token(self, **kwargs: dict):
         """Fetch a new access token using client credentials."""
-        headers = {
-            "Authorization": "Basic "
-            + base64.b64encode(f"{self.CONSUMER_KEY}:{self.CONSUMER_SECRET}".encode("utf-8")).decode("utf-8")
-        }
+        headers = {"Authorization": self._basic_auth_header}
         try:
-            response = requests.post(self.REFRESH_TOKEN_URL, data=kwargs, headers=headers)
-            response.raise_for_status()
-            self.ACCESS_TOKEN = msj.decode(response.content)["access_token"]
+            with StudentApp._token_lock:
+                response = _sync_session.post(self.REFRESH_TOKEN_URL, data=kwargs, headers=headers, timeout=10)
+                response.raise_for_status()
+                token = _TOKEN_DECODER.decode(response.content)
+                StudentApp._token_cache["value"] = token.access_token
+                StudentApp._token_cache["auth_header"] = f"Bearer {token.access_token}"
+                StudentApp._token_cache["expires_at"] = time.time() + token.expires_in
             logger.info("Token refreshed successfully.")
         except requests.RequestException as e:
             logger.error(f"Token refresh failed: {e}")
@@ -69,98 +350,152 @@ class StudentApp:
             logger.error(f"Failed to decode token refresh response: {e}")
             raise DecodeError("Failed to decode token refresh response") from e
 
-    def _make_request(self, endpoint: str, params: dict = None, fmt: str = "json", formatted: bool = True) -> dict | str:
-        """Send a GET request to the specified endpoint. Defaults to JSON format.
-        
+    async def _make_request(
+        self, endpoint: str, params: dict | list[tuple] = None, fmt: str = "json", formatted: bool = True
+    ) -> bytes | str:
+        """Send an asynchronous GET request to the specified endpoint. Defaults to JSON format.
+
         Processing of data (e.g. decoding, formatting, etc.) should be handled externally.
         """
-        headers = {
-            "Authorization": f"Bearer {self.ACCESS_TOKEN}",
-            "Accept": f"application/{fmt}",
-        }
         url = f"{STUDENT_APP_BASE_URL}{endpoint}"
+        await self._ensure_token()
         try:
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            logger.debug(f"Request to {url} successful.")
-            match fmt:
-                case "json":
-                    response = response.content
-                    return response
-                case "xml":
-                    response = response.text
-                    return response
-                case "ical":
-                    response = response.text
-                    return response
-                case _:
-                    return response
-        except requests.RequestException as e:
+            # A 401 means the shared token expired early or was revoked, so it is
+            # refreshed and the request retried once.
+            for attempt in range(2):
+                headers = {
+                    "Authorization": StudentApp._token_cache["auth_header"],
+                    "Accept": f"application/{fmt}",
+                }
+                async with _get_client().get(url, params=params, headers=headers) as response:
+                    if response.status != 401 or attempt > 0:
+                        response.raise_for_status()
+                        logger.debug("Request to %s successful.", url)
+                        match fmt:
+                            case "json":
+                                return await response.read()
+                            case "ical":
+                                # iCal is UTF-8 by definition (RFC 5545), and the API omits the
+                                # charset, so decode explicitly rather than sniffing the body.
+                                return await response.text(encoding="utf-8")
+                            case _:
+                                return await response.read()
+                logger.info(f"Request to {url} was unauthorized; refreshing the access token.")
+                await asyncio.to_thread(self._refresh_token, grant_type="client_credentials")
+        except aiohttp.ClientError as e:
             logger.error(f"Request to {url} failed: {e}")
-            raise requests.RequestException(f"Request failed: {e}") from e
+            raise aiohttp.ClientError(f"Request failed: {e}") from e
+
+    def validate_xml(self, xml_str: str | bytes | etree._Element, schema: etree.XMLSchema) -> bool:
+        """Validate an XML document against a compiled XSD schema provided by Princeton OIT.
 
-    def validate_xml(self, xml_str: str, xsd_str: str) -> bool:
-        """Validate an XML string against an XSD schema provided by Princeton OIT."""
+        Accepts either the raw document or an already-parsed root element, so callers that go
+        on to convert the document can parse it only once.
+        """
+        if isinstance(xml_str, str):
+            xml_str = xml_str.encode("utf-8")
         try:
-            schema = xmlschema.XMLSchema(xsd_str)
-            schema.validate(xml_str)
+            root = xml_str if isinstance(xml_str, etree._Element) else etree.fromstring(xml_str)
+            schema.assertValid(root)
             logger.info("XML validation successful.")
             return True
-        except xmlschema.XMLSchemaValidationError as e:
+        except (etree.DocumentInvalid, etree.XMLSyntaxError) as e:
             logger.error(f"XML validation error: {e}")
             return False
 
-    def _remove_xml_namespace(self, document: ET.Element):
-        """Generalized namespace removal from XML tags."""
-        for element in document.iter():
-            if "}" in element.tag:
-                element.tag = element.tag.split("}", 1)[1] # Remove namespace
-        logger.info("XML namespaces removed.")
-
-    def _xml_to_dict(self, element: ET.Element) -> dict:
-        """Convert an XML element and its children into a Python dictionary."""
-        data = {element.tag: {} if element.attrib else None}
-        children = list(element)
-
-        if children:
-            child_dict = {}
-            for child_dict_entry in map(self._xml_to_dict, children):
-                for key, value in child_dict_entry.items():
-                    if key in child_dict:
-                        if not isinstance(child_dict[key], list):
-                            child_dict[key] = [child_dict[key]]
-                        child_dict[key].append(value)
-                    else:
-                        child_dict[key] = value
-            data = {element.tag: child_dict}
-
-        if element.attrib:
-            data[element.tag].update((key, value) for key, value in element.attrib.items())
-
-        if element.text and element.text.strip():
-            if children or element.attrib:
-                data[element.tag]["text"] = element.text.strip()
+    def _xml_to_dict(self, element: etree._Element, force_list: tuple[str, ...] = ()) -> dict:
+        """Convert an XML element and its children into a Python dictionary.
+
+        Namespaces are stripped from tags as they are visited, so no separate pass over
+        the tree is needed. Children whose tag is listed in `force_list` are always
+        collected into a list, even when only one of them is present.
+        """
+        # Post-order walk with an explicit stack: each frame holds an element, an iterator
+        # over its remaining children, and the converted children grouped by tag.
+        stack = [(element, iter(element), defaultdict(list))]
+        while stack:
+            node, children, child_values = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, iter(child), defaultdict(list)))
+                continue
+            stack.pop()
+
+            if child_values:
+                value = {
+                    key: values if len(values) > 1 or key in force_list else values[0]
+                    for key, values in child_values.items()
+                }
             else:
-                data[element.tag] = element.text.strip()
+                value = {} if node.attrib else None
+            if node.attrib:
+                value.update(node.attrib)
+            text = node.text.strip() if node.text else ""
+            if text:
+                if child_values or node.attrib:
+                    value["text"] = text
+                else:
+                    value = text
 
-        logger.info(f"XML element {element.tag} converted to dict.")
-        return data
+            tag = node.tag.rpartition("}")[2]
+            if not stack:
+                return {tag: value}
+            stack[-1][2][tag].append(value)
 
-    def _parse_xml(self, xml: str) -> dict:
+    def _parse_xml(self, xml: str | bytes) -> dict:
         """Parse the XML response and converts it into a Python dictionary."""
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
         try:
-            root = ET.fromstring(xml)
-            self._remove_xml_namespace(root)
+            parser = etree.XMLParser(remove_comments=True, remove_pis=True)
+            root = etree.fromstring(xml, parser)
             logger.debug("XML parsed successfully.")
             return self._xml_to_dict(root)
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             # Log the full XML response that caused the failure
             logger.error(f"Failed to parse XML response. Raw content: {xml}")
-            logger.error(f"ParseError details: {e}")
+            logger.error(f"XMLSyntaxError details: {e}")
             raise ValueError(f"Failed to parse XML response: {e}") from e
 
-    def _parse_ical(self, ical_text: str) -> dict:
-        """Parse iCal text and returns a structured dictionary."""
+    def _iterparse_xml(
+        self, xml: str | bytes | etree._Element, tag: str, force_list: tuple[str, ...] = ()
+    ) -> Iterator[dict]:
+        """Stream the elements named `tag` out of an XML document as dictionaries.
+
+        Each matching element is converted as soon as its end tag is parsed and then
+        freed, so the full document tree is never built. An already-parsed root element
+        (e.g. one that was just validated) is walked in place instead of being re-parsed.
+        See `_xml_to_dict` for `force_list`.
+        """
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        if isinstance(xml, etree._Element):
+            elements = xml.iter(f"{{*}}{tag}")
+        else:
+            events = etree.iterparse(BytesIO(xml), tag=f"{{*}}{tag}", remove_comments=True, remove_pis=True)
+            elements = (element for _, element in events)
+        try:
+            for element in elements:
+                yield self._xml_to_dict(element, force_list)[tag]
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Failed to parse XML response. Raw content: {xml}")
+            logger.error(f"XMLSyntaxError details: {e}")
+            raise ValueError(f"Failed to parse XML response: {e}") from e
+
+    @staticmethod
+    def _parse_ical(ical_text: str, strict: bool = False) -> dict:
+        """Parse iCal text and returns a structured dictionary.
+
+        By default the text is read with a single-pass line scanner that only extracts
+        the properties used below. Pass `strict=True` to parse with the full icalendar
+        library instead, e.g. for feeds using features the scanner does not handle.
+        """
+        if not strict:
+            return _scan_ical(ical_text)
+
         cal = Calendar.from_ical(ical_text)
         calendar_info = {}
         events = []
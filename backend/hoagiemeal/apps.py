@@ -0,0 +1,34 @@
+"""Django application configuration for the Hoagie Meal backend.
+
+Copyright © 2021-2024 Hoagie Club and affiliates.
+
+Licensed under the MIT License. You may obtain a copy of the License at:
+
+    https://github.com/hoagieclub/meal/blob/main/LICENSE
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, subject to the following conditions:
+
+This software is provided "as-is", without warranty of any kind.
+"""
+
+import atexit
+
+from django.apps import AppConfig
+
+
+class HoagieMealConfig(AppConfig):
+    """Application configuration for Hoagie Meal."""
+
+    name = "hoagiemeal"
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        """Register model signal receivers and shutdown hooks for resources shared across requests."""
+        from hoagiemeal import signals  # noqa: F401
+        from hoagiemeal.api.student_app import close_session_at_exit
+
+        atexit.register(close_session_at_exit)
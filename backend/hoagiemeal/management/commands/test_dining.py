@@ -1,3 +1,5 @@
+import sys
+
 from django.core.management.base import BaseCommand
 from hoagiemeal.tests import dining_api
 
@@ -5,5 +7,30 @@ from hoagiemeal.tests import dining_api
 class Command(BaseCommand):
     help = "Run the dining API testing script"
 
-    def handle(self, *args, **kwargs):
-        dining_api.main()
+    def add_arguments(self, parser):
+        """Register the query options that skip the interactive prompts."""
+        parser.add_argument(
+            "--meal", action="append", dest="meal_types", choices=dining_api.MEAL_TYPES, help="Meal type to fetch."
+        )
+        parser.add_argument(
+            "--location", action="append", dest="locations", help="Term to search for in location names."
+        )
+        parser.add_argument(
+            "--date", action="append", dest="dates", type=dining_api.parse_date, help="Date to fetch (YYYY-MM-DD)."
+        )
+        parser.add_argument("--category-id", action="append", dest="category_ids", help="Location category ID.")
+        parser.add_argument("--events", action="store_true", dest="fetch_events", help="Also fetch dining events.")
+
+    def handle(self, *args, **options):
+        """Run the given queries, or prompt for them when none were passed."""
+        queries = dining_api.queries_from_options(
+            meal_types=options["meal_types"],
+            locations=options["locations"],
+            dates=options["dates"],
+            category_ids=options["category_ids"],
+            fetch_events=options["fetch_events"],
+        )
+        # Prompt only when nothing was given on the command line and someone can answer.
+        if not queries and sys.stdin.isatty():
+            queries = None
+        dining_api.main(queries)
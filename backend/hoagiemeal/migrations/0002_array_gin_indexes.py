@@ -0,0 +1,43 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:26
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("hoagiemeal", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["dietary_restrictions"], name="users_dietary_eed356_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="dininghall",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["amenities"], name="dining_hall_ameniti_7ea859_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="menuitem",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["allergens"], name="menu_items_allerge_8d8522_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="menuitem",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["ingredients"], name="menu_items_ingredi_d16bae_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="menuitemmetrics",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["seasonal_availability"], name="menu_item_m_seasona_2da110_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="menuitemmetrics",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["common_pairings"], name="menu_item_m_common__a07b3e_gin"),
+        ),
+        migrations.AddIndex(
+            model_name="userdietaryprofile",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["excluded_ingredients"], name="user_dietar_exclude_86cf23_gin"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:26
+
+import pgvector.django.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0002_array_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="foodvector",
+            name="food_vector_idx",
+        ),
+        migrations.AddIndex(
+            model_name="foodvector",
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=["vector"], m=16, name="food_vector_hnsw", opclasses=["vector_cosine_ops"]),
+        ),
+    ]
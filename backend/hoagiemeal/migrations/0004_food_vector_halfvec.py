@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:26
+
+import pgvector.django.halfvec
+import pgvector.django.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0003_food_vector_hnsw_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="foodvector",
+            name="food_vector_hnsw",
+        ),
+        migrations.AlterField(
+            model_name="foodvector",
+            name="vector",
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=384, help_text="Vector embedding of menu item characteristics"),
+        ),
+        migrations.AddIndex(
+            model_name="foodvector",
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=["vector"], m=16, name="food_vector_hnsw", opclasses=["halfvec_cosine_ops"]),
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:27
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0004_food_vector_halfvec"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="foodvector",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="menu",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="menuitem",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="menuitemmetrics",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="menuitemnutrient",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="userdietaryprofile",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelOptions(
+            name="usermeallog",
+            options={"base_manager_name": "prefetch_manager"},
+        ),
+        migrations.AlterModelManagers(
+            name="foodvector",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="menu",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="menuitem",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="menuitemmetrics",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="menuitemnutrient",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="userdietaryprofile",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name="usermeallog",
+            managers=[
+                ("objects", django.db.models.manager.Manager()),
+                ("prefetch_manager", django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="foodvector",
+            name="menu_item",
+            field=auto_prefetch.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="food_vector", to="hoagiemeal.menuitem"),
+        ),
+        migrations.AlterField(
+            model_name="menu",
+            name="dining_hall",
+            field=auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="menus", to="hoagiemeal.dininghall"),
+        ),
+        migrations.AlterField(
+            model_name="menuitem",
+            name="menu",
+            field=auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="menu_items", to="hoagiemeal.menu"),
+        ),
+        migrations.AlterField(
+            model_name="menuitemmetrics",
+            name="menu_item",
+            field=auto_prefetch.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="metrics", to="hoagiemeal.menuitem"),
+        ),
+        migrations.AlterField(
+            model_name="menuitemnutrient",
+            name="menu_item",
+            field=auto_prefetch.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="nutrient_info", to="hoagiemeal.menuitem"),
+        ),
+        migrations.AlterField(
+            model_name="userdietaryprofile",
+            name="user",
+            field=auto_prefetch.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="dietary_profile", to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name="usermeallog",
+            name="menu_item",
+            field=auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="consumption_logs", to="hoagiemeal.menuitem"),
+        ),
+        migrations.AlterField(
+            model_name="usermeallog",
+            name="user",
+            field=auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="meal_logs", to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0005_auto_prefetch"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="menuitem",
+            index=models.Index(fields=["menu", "name"], include=("link", "allergens"), name="mi_menu_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="usermeallog",
+            index=models.Index(fields=["user", "menu_item"], include=("portions", "consumed_at"), name="uml_user_item_idx"),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:28
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_menu_item_name(apps, schema_editor):
+    MenuItem = apps.get_model("hoagiemeal", "MenuItem")
+    name = Subquery(MenuItem.objects.filter(pk=OuterRef("menu_item_id")).values("name")[:1])
+    for model_name in ("MenuItemNutrient", "MenuItemMetrics", "FoodVector"):
+        apps.get_model("hoagiemeal", model_name).objects.update(menu_item_name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0006_covering_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="foodvector",
+            name="menu_item_name",
+            field=models.CharField(blank=True, editable=False, help_text="Copy of the menu item name, kept in sync by signals", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="menuitemmetrics",
+            name="menu_item_name",
+            field=models.CharField(blank=True, editable=False, help_text="Copy of the menu item name, kept in sync by signals", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="menu_item_name",
+            field=models.CharField(blank=True, editable=False, help_text="Copy of the menu item name, kept in sync by signals", max_length=255),
+        ),
+        migrations.RunPython(backfill_menu_item_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,158 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+NUTRIENTS = (
+    "total_fat",
+    "saturated_fat",
+    "trans_fat",
+    "cholesterol",
+    "sodium",
+    "total_carbohydrates",
+    "dietary_fiber",
+    "sugars",
+    "protein",
+    "vitamin_d",
+    "potassium",
+    "calcium",
+    "iron",
+)
+
+TO_HUNDREDTHS = "UPDATE menu_item_nutrients SET " + ", ".join(f"{n}_x100 = ROUND({n} * 100)" for n in NUTRIENTS)
+FROM_HUNDREDTHS = "UPDATE menu_item_nutrients SET " + ", ".join(f"{n} = {n}_x100 / 100.0" for n in NUTRIENTS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0007_menu_item_name"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="menuitemnutrient",
+            name="menu_item_n_protein_834583_idx",
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="calcium_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="cholesterol_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="dietary_fiber_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="iron_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="potassium_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="protein_x100",
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="saturated_fat_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="sodium_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="sugars_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="total_carbohydrates_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="total_fat_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="trans_fat_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="menuitemnutrient",
+            name="vitamin_d_x100",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="menuitemnutrient",
+            index=models.Index(fields=["protein_x100"], name="menu_item_n_protein_42c13f_idx"),
+        ),
+        migrations.RunSQL(TO_HUNDREDTHS, FROM_HUNDREDTHS),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="calcium",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="cholesterol",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="dietary_fiber",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="iron",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="potassium",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="protein",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="saturated_fat",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="sodium",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="sugars",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="total_carbohydrates",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="total_fat",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="trans_fat",
+        ),
+        migrations.RemoveField(
+            model_name="menuitemnutrient",
+            name="vitamin_d",
+        ),
+    ]
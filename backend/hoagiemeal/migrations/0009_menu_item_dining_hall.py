@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:31
+
+import auto_prefetch
+import django.db.models.deletion
+from django.db import migrations
+
+BACKFILL_DINING_HALL = """
+UPDATE menu_items SET dining_hall_id = menus.dining_hall_id
+FROM menus WHERE menu_items.menu_id = menus.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0008_nutrient_fixed_point"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="menuitem",
+            name="dining_hall",
+            field=auto_prefetch.ForeignKey(editable=False, help_text="Copy of the menu's dining hall, kept in sync by signals", null=True, on_delete=django.db.models.deletion.CASCADE, related_name="menu_items", to="hoagiemeal.dininghall"),
+        ),
+        migrations.RunSQL(BACKFILL_DINING_HALL, migrations.RunSQL.noop),
+        # The backfill queues deferred FK checks, and PostgreSQL refuses to ALTER a table
+        # with pending trigger events, so run them before tightening the column.
+        migrations.RunSQL("SET CONSTRAINTS ALL IMMEDIATE", migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name="menuitem",
+            name="dining_hall",
+            field=auto_prefetch.ForeignKey(editable=False, help_text="Copy of the menu's dining hall, kept in sync by signals", on_delete=django.db.models.deletion.CASCADE, related_name="menu_items", to="hoagiemeal.dininghall"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:33
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0009_menu_item_dining_hall"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userdietaryprofile",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["cuisine_preferences"], name="udp_cuisine_gin", opclasses=["jsonb_path_ops"]),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:33
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+# Bit (month - 1) of the mask is set when the month appears in the old array.
+TO_MASK = "UPDATE menu_item_metrics SET availability_mask = " + " | ".join(
+    f"(CASE WHEN {month} = ANY(seasonal_availability) THEN {1 << (month - 1)} ELSE 0 END)" for month in range(1, 13)
+)
+FROM_MASK = """
+UPDATE menu_item_metrics SET seasonal_availability = ARRAY(
+    SELECT month FROM generate_series(1, 12) AS month WHERE availability_mask & (1 << (month - 1)) <> 0
+)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hoagiemeal", "0010_cuisine_preferences_gin"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="menuitemmetrics",
+            name="menu_item_m_seasona_2da110_gin",
+        ),
+        migrations.AddField(
+            model_name="menuitemmetrics",
+            name="availability_mask",
+            field=models.PositiveSmallIntegerField(default=0, help_text="Monthly availability pattern; bit i is set if served in month i + 1"),
+        ),
+        migrations.RunSQL(TO_MASK, migrations.RunSQL.noop),
+        # Relax the array before dropping it, so that on rollback it is re-added as nullable,
+        # filled from the mask, and only then made NOT NULL again.
+        migrations.AlterField(
+            model_name="menuitemmetrics",
+            name="seasonal_availability",
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.PositiveSmallIntegerField(), help_text="Monthly availability pattern (1-12)", null=True, size=12),
+        ),
+        migrations.RunSQL(migrations.RunSQL.noop, FROM_MASK),
+        migrations.RemoveField(
+            model_name="menuitemmetrics",
+            name="seasonal_availability",
+        ),
+    ]
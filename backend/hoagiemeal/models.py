@@ -15,13 +15,15 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import auto_prefetch
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.utils.translation import gettext_lazy as _
-from pgvector.django import VectorField
+from pgvector.django import HalfVectorField, HnswIndex
 
 
 class CustomUser(AbstractUser):
@@ -52,6 +54,9 @@ class CustomUser(AbstractUser):
         db_table = "users"
         verbose_name = _("user")
         verbose_name_plural = _("users")
+        indexes = [
+            GinIndex(fields=["dietary_restrictions"]),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} ({self.net_id})"
@@ -77,13 +82,14 @@ class DiningHall(models.Model):
         indexes = [
             models.Index(fields=["database_id"]),
             models.Index(fields=["name"]),
+            GinIndex(fields=["amenities"]),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.building_name})"
 
 
-class Menu(models.Model):
+class Menu(auto_prefetch.Model):
     """Represents a daily menu for a specific meal at a dining hall."""
 
     class MealType(models.TextChoices):
@@ -91,12 +97,12 @@ class Menu(models.Model):
         LUNCH = "LU", _("Lunch")
         DINNER = "DI", _("Dinner")
 
-    dining_hall = models.ForeignKey(DiningHall, on_delete=models.CASCADE, related_name="menus")
+    dining_hall = auto_prefetch.ForeignKey(DiningHall, on_delete=models.CASCADE, related_name="menus")
     date = models.DateField(default=timezone.now, db_index=True)
     meal = models.CharField(max_length=2, choices=MealType.choices, db_index=True)
     last_fetched = models.DateTimeField(auto_now=True, help_text=_("Last time menu was updated from API"))
 
-    class Meta:
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "menus"
         unique_together = ("dining_hall", "date", "meal")
         indexes = [
@@ -107,12 +113,46 @@ class Menu(models.Model):
         return f"{self.dining_hall.name} - {self.get_meal_display()} on {self.date}"
 
 
-class MenuItem(models.Model):
+class MenuItemQuerySet(auto_prefetch.QuerySet):
+    """QuerySet helpers for MenuItem."""
+
+    def with_nutrients(self):
+        """Join the nutrient info, metrics, menu and dining hall into a single query."""
+        return self.select_related("nutrient_info", "metrics", "menu__dining_hall")
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create menu items in bulk, filling in each item's dining hall from its menu.
+
+        bulk_create skips the pre_save signal that copies the menu's dining hall, and the
+        column is NOT NULL, so items without one get it here. Menus that are not already
+        loaded are looked up in a single query.
+        """
+        objs = list(objs)
+        missing = {
+            obj.menu_id for obj in objs if obj.dining_hall_id is None and not MenuItem.menu.is_cached(obj)
+        }
+        halls = dict(Menu.objects.filter(pk__in=missing).values_list("pk", "dining_hall_id")) if missing else {}
+        for obj in objs:
+            if obj.dining_hall_id is None:
+                obj.dining_hall_id = (
+                    obj.menu.dining_hall_id if MenuItem.menu.is_cached(obj) else halls.get(obj.menu_id)
+                )
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class MenuItem(auto_prefetch.Model):
     """Core food item model representing a dish served in dining halls."""
 
     id = models.BigAutoField(primary_key=True)
     api_id = models.PositiveIntegerField(unique=True, help_text=_("Original menu item ID from the API"))
-    menu = models.ForeignKey(Menu, on_delete=models.CASCADE, related_name="menu_items")
+    menu = auto_prefetch.ForeignKey(Menu, on_delete=models.CASCADE, related_name="menu_items")
+    dining_hall = auto_prefetch.ForeignKey(
+        DiningHall,
+        on_delete=models.CASCADE,
+        related_name="menu_items",
+        editable=False,
+        help_text=_("Copy of the menu's dining hall, kept in sync by signals"),
+    )
     name = models.CharField(max_length=255, db_index=True)
     description = models.TextField(blank=True)
     link = models.URLField(max_length=500, blank=True)
@@ -121,56 +161,104 @@ class MenuItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    class Meta:
+    objects = MenuItemQuerySet.as_manager()
+
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "menu_items"
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["api_id"]),
+            # Serves "items on a menu, by name" and covers the listed columns, so such
+            # lookups are answered from the index without visiting the table.
+            models.Index(fields=["menu", "name"], include=["link", "allergens"], name="mi_menu_name_idx"),
+            GinIndex(fields=["allergens"]),
+            GinIndex(fields=["ingredients"]),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.api_id})"
 
 
-class MenuItemNutrient(models.Model):
+def _hundredths(field_name: str) -> property:
+    """Expose an integer field holding hundredths of a unit as a float in that unit."""
+
+    def getter(self):
+        value = getattr(self, field_name)
+        return None if value is None else value / 100
+
+    def setter(self, value):
+        setattr(self, field_name, None if value is None else round(value * 100))
+
+    return property(getter, setter)
+
+
+class MenuItemNutrient(auto_prefetch.Model):
     """Detailed nutritional information for menu items."""
 
-    menu_item = models.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="nutrient_info")
+    menu_item = auto_prefetch.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="nutrient_info")
+    menu_item_name = models.CharField(
+        max_length=255, blank=True, editable=False, help_text=_("Copy of the menu item name, kept in sync by signals")
+    )
     serving_size = models.CharField(max_length=50, blank=True)
     serving_unit = models.CharField(max_length=20, blank=True)
     calories = models.PositiveSmallIntegerField(null=True, blank=True, db_index=True)
     calories_from_fat = models.PositiveSmallIntegerField(null=True, blank=True)
-    total_fat = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    saturated_fat = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    trans_fat = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    cholesterol = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    sodium = models.DecimalField(max_digits=7, decimal_places=2, null=True, blank=True)
-    total_carbohydrates = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    dietary_fiber = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    sugars = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    protein = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True, db_index=True)
-    vitamin_d = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    potassium = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    calcium = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
-    iron = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True)
+    # Nutrient amounts are stored as integer hundredths of their unit (e.g. 12.34 g as 1234),
+    # which is narrower than numeric and keeps arithmetic in integers.
+    total_fat_x100 = models.IntegerField(null=True, blank=True)
+    saturated_fat_x100 = models.IntegerField(null=True, blank=True)
+    trans_fat_x100 = models.IntegerField(null=True, blank=True)
+    cholesterol_x100 = models.IntegerField(null=True, blank=True)
+    sodium_x100 = models.IntegerField(null=True, blank=True)
+    total_carbohydrates_x100 = models.IntegerField(null=True, blank=True)
+    dietary_fiber_x100 = models.IntegerField(null=True, blank=True)
+    sugars_x100 = models.IntegerField(null=True, blank=True)
+    protein_x100 = models.IntegerField(null=True, blank=True, db_index=True)
+    vitamin_d_x100 = models.IntegerField(null=True, blank=True)
+    potassium_x100 = models.IntegerField(null=True, blank=True)
+    calcium_x100 = models.IntegerField(null=True, blank=True)
+    iron_x100 = models.IntegerField(null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    class Meta:
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "menu_item_nutrients"
         indexes = [
             models.Index(fields=["calories"]),
-            models.Index(fields=["protein"]),
+            models.Index(fields=["protein_x100"]),
         ]
 
+    # Amounts in their natural unit, as floats.
+    total_fat = _hundredths("total_fat_x100")
+    saturated_fat = _hundredths("saturated_fat_x100")
+    trans_fat = _hundredths("trans_fat_x100")
+    cholesterol = _hundredths("cholesterol_x100")
+    sodium = _hundredths("sodium_x100")
+    total_carbohydrates = _hundredths("total_carbohydrates_x100")
+    dietary_fiber = _hundredths("dietary_fiber_x100")
+    sugars = _hundredths("sugars_x100")
+    protein = _hundredths("protein_x100")
+    vitamin_d = _hundredths("vitamin_d_x100")
+    potassium = _hundredths("potassium_x100")
+    calcium = _hundredths("calcium_x100")
+    iron = _hundredths("iron_x100")
+
     def __str__(self):
-        return f"Nutrients for {self.menu_item.name}"
+        return f"Nutrients for {self.menu_item_name}"
+
 
+class UserMealLogManager(auto_prefetch.Manager):
+    """Default manager for UserMealLog that joins the objects a log is usually displayed with."""
 
-class UserMealLog(models.Model):
+    def get_queryset(self):
+        """Select the user and the menu item's menu and dining hall along with each log."""
+        return super().get_queryset().select_related("user", "menu_item__menu__dining_hall")
+
+
+class UserMealLog(auto_prefetch.Model):
     """Tracks user meal consumption with portion sizes and timestamps."""
 
-    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="meal_logs")
-    menu_item = models.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name="consumption_logs")
+    user = auto_prefetch.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="meal_logs")
+    menu_item = auto_prefetch.ForeignKey(MenuItem, on_delete=models.CASCADE, related_name="consumption_logs")
     portions = models.DecimalField(
         max_digits=4,
         decimal_places=2,
@@ -183,49 +271,66 @@ class UserMealLog(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    class Meta:
+    objects = UserMealLogManager()
+
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "user_meal_logs"
         indexes = [
             models.Index(fields=["user", "consumed_at"]),
             models.Index(fields=["consumed_at"]),
+            models.Index(fields=["user", "menu_item"], include=["portions", "consumed_at"], name="uml_user_item_idx"),
         ]
 
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.menu_item.name} ({self.portions} servings)"
 
 
-class FoodVector(models.Model):
+class FoodVector(auto_prefetch.Model):
     """Stores vector embeddings for menu items to power ML-based recommendations."""
 
-    menu_item = models.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="food_vector")
-    vector = VectorField(
+    menu_item = auto_prefetch.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="food_vector")
+    menu_item_name = models.CharField(
+        max_length=255, blank=True, editable=False, help_text=_("Copy of the menu item name, kept in sync by signals")
+    )
+    # Stored as half-precision floats, halving the size of each row and of the index.
+    vector = HalfVectorField(
         dimensions=384,  # Using BERT-like embedding size
         help_text=_("Vector embedding of menu item characteristics"),
     )
     last_updated = models.DateTimeField(auto_now=True)
 
-    class Meta:
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "food_vectors"
         indexes = [
-            models.Index(fields=["vector"], name="food_vector_idx", opclasses=["vector_ops"]),
+            # Approximate nearest-neighbour index for cosine similarity searches.
+            HnswIndex(
+                name="food_vector_hnsw",
+                fields=["vector"],
+                m=16,
+                ef_construction=64,
+                opclasses=["halfvec_cosine_ops"],
+            ),
         ]
 
     def __str__(self):
-        return f"Vector for {self.menu_item.name}"
+        return f"Vector for {self.menu_item_name}"
 
 
-class MenuItemMetrics(models.Model):
+class MenuItemMetrics(auto_prefetch.Model):
     """Aggregated metrics and cached computations for menu items. Updated periodically via celery tasks."""
 
-    menu_item = models.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="metrics")
+    menu_item = auto_prefetch.OneToOneField(MenuItem, on_delete=models.CASCADE, related_name="metrics")
+    menu_item_name = models.CharField(
+        max_length=255, blank=True, editable=False, help_text=_("Copy of the menu item name, kept in sync by signals")
+    )
     times_served = models.PositiveIntegerField(default=0)
     times_consumed = models.PositiveIntegerField(default=0)
     avg_portion_size = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     popularity_score = models.DecimalField(
         max_digits=5, decimal_places=2, default=0.0, help_text=_("Calculated score based on consumption patterns")
     )
-    seasonal_availability = ArrayField(
-        models.PositiveSmallIntegerField(), size=12, help_text=_("Monthly availability pattern (1-12)")
+    availability_mask = models.PositiveSmallIntegerField(
+        default=0, help_text=_("Monthly availability pattern; bit i is set if served in month i + 1")
     )
     last_served = models.DateField(null=True, blank=True)
     common_pairings = ArrayField(
@@ -233,22 +338,27 @@ class MenuItemMetrics(models.Model):
     )
     updated_at = models.DateTimeField(auto_now=True)
 
-    class Meta:
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "menu_item_metrics"
         indexes = [
             models.Index(fields=["popularity_score"]),
             models.Index(fields=["times_consumed"]),
             models.Index(fields=["last_served"]),
+            GinIndex(fields=["common_pairings"]),
         ]
 
     def __str__(self):
-        return f"Metrics for {self.menu_item.name}"
+        return f"Metrics for {self.menu_item_name}"
 
+    def available_in(self, month: int) -> bool:
+        """Return whether the menu item is served in the given month (1-12)."""
+        return bool(self.availability_mask & (1 << (month - 1)))
 
-class UserDietaryProfile(models.Model):
+
+class UserDietaryProfile(auto_prefetch.Model):
     """Detailed dietary profile for personalized recommendations."""
 
-    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name="dietary_profile")
+    user = auto_prefetch.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name="dietary_profile")
     favorite_menu_items = models.ManyToManyField(MenuItem, related_name="favorited_by")
     excluded_ingredients = ArrayField(models.CharField(max_length=100), blank=True, default=list)
     preferred_dining_halls = models.ManyToManyField(DiningHall, related_name="preferred_by")
@@ -257,8 +367,13 @@ class UserDietaryProfile(models.Model):
     sustainability_preference = models.BooleanField(default=False, help_text=_("Preference for sustainable options"))
     updated_at = models.DateTimeField(auto_now=True)
 
-    class Meta:
+    class Meta(auto_prefetch.Model.Meta):
         db_table = "user_dietary_profiles"
+        indexes = [
+            GinIndex(fields=["excluded_ingredients"]),
+            # jsonb_path_ops only supports containment (@>), but is smaller and faster for it.
+            GinIndex(fields=["cuisine_preferences"], name="udp_cuisine_gin", opclasses=["jsonb_path_ops"]),
+        ]
 
     def __str__(self):
         return f"Dietary Profile - {self.user.get_full_name()}"
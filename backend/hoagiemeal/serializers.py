@@ -27,10 +27,8 @@ class DiningLocationSerializer(serializers.Serializer):
     amenities = serializers.SerializerMethodField()
 
     def get_amenities(self, obj):
-        amenities_data = obj["amenities"]["amenity"]
-        if isinstance(amenities_data, list):
-            return [amenity["name"] for amenity in amenities_data]
-        return [amenities_data["name"]]
+        # DiningAPI.get_locations always parses <amenity> into a list, even for a single one.
+        return [amenity["name"] for amenity in obj["amenities"]["amenity"]]
 
 
 class MenuItemSerializer(serializers.Serializer):
@@ -25,6 +25,13 @@ SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY")
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.environ.get("DEBUG", "False").lower() in ("true", "1", "t")
 
+# Validate upstream Princeton OIT XML against its XSD. Defaults to DEBUG so that
+# production skips the extra CPU work on a trusted first-party API.
+VALIDATE_UPSTREAM_XML = os.environ.get("VALIDATE_UPSTREAM_XML", str(DEBUG)).lower() in ("true", "1", "t")
+# When strict validation is off, validate this fraction of responses anyway and only
+# log a warning on failure, so schema drift still surfaces without failing requests.
+VALIDATE_UPSTREAM_XML_SAMPLE_RATE = float(os.environ.get("VALIDATE_UPSTREAM_XML_SAMPLE_RATE", "0.01"))
+
 ALLOWED_HOSTS = ["localhost", "127.0.0.1"] + os.getenv("ALLOWED_HOSTS", "").split(",")
 CORS_ALLOW_CREDENTIALS = True
 
@@ -80,6 +87,21 @@ os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL") if DEBUG else os.get
 DATABASES = {"default": dj_database_url.config(default=os.getenv("DATABASE_URL"), ssl_require=False)}
 DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+CACHES = {
+    "default": (
+        {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": os.getenv("REDIS_URL")}
+        if os.getenv("REDIS_URL")
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+# On-disk cache of scraped label pages, revalidated with conditional GETs. Anchored to
+# BASE_DIR so the web workers and management commands share it.
+SCRAPER_CACHE_DIR = Path(os.environ.get("SCRAPER_CACHE_DIR", BASE_DIR / ".cache" / "hoagie"))
+
 # Set the custom user model for Hoagie Meal
 AUTH_USER_MODEL = "hoagiemeal.CustomUser"
 
@@ -0,0 +1,68 @@
+"""Model signal receivers for the Hoagie Meal backend.
+
+Copyright © 2021-2024 Hoagie Club and affiliates.
+
+Licensed under the MIT License. You may obtain a copy of the License at:
+
+    https://github.com/hoagieclub/meal/blob/main/LICENSE
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, subject to the following conditions:
+
+This software is provided "as-is", without warranty of any kind.
+"""
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from hoagiemeal.models import FoodVector, Menu, MenuItem, MenuItemMetrics, MenuItemNutrient
+
+# Models that keep a denormalized copy of their menu item's name in `menu_item_name`.
+MENU_ITEM_NAME_MODELS = (MenuItemNutrient, MenuItemMetrics, FoodVector)
+
+
+def copy_menu_item_name(sender, instance, **kwargs):
+    """Copy the related menu item's name onto the instance before it is saved."""
+    instance.menu_item_name = instance.menu_item.name
+
+
+for model in MENU_ITEM_NAME_MODELS:
+    pre_save.connect(copy_menu_item_name, sender=model, dispatch_uid=f"copy_menu_item_name_{model.__name__}")
+
+
+@receiver(post_save, sender=MenuItem, dispatch_uid="propagate_menu_item_name")
+def propagate_menu_item_name(sender, instance, created, **kwargs):
+    """Keep the denormalized names in sync when a menu item is renamed."""
+    if created:
+        return
+    for model in MENU_ITEM_NAME_MODELS:
+        model.objects.filter(menu_item=instance).exclude(menu_item_name=instance.name).update(
+            menu_item_name=instance.name
+        )
+
+
+@receiver(pre_save, sender=MenuItem, dispatch_uid="copy_menu_dining_hall")
+def copy_menu_dining_hall(sender, instance, update_fields=None, **kwargs):
+    """Copy the menu's dining hall onto the menu item before it is saved.
+
+    Uses the menu if it is already loaded, and otherwise fetches only its dining hall ID.
+    Saves limited to fields other than the menu skip the lookup. MenuItem.objects.bulk_create
+    does not send this signal and fills the dining hall in itself.
+    """
+    if update_fields is not None and "menu" not in update_fields:
+        return
+    if MenuItem.menu.is_cached(instance):
+        instance.dining_hall_id = instance.menu.dining_hall_id
+    else:
+        instance.dining_hall_id = Menu.objects.values_list("dining_hall_id", flat=True).get(pk=instance.menu_id)
+
+
+@receiver(post_save, sender=Menu, dispatch_uid="propagate_menu_dining_hall")
+def propagate_menu_dining_hall(sender, instance, created, **kwargs):
+    """Keep the menu items' dining hall in sync when a menu is moved to another hall."""
+    if created:
+        return
+    instance.menu_items.exclude(dining_hall_id=instance.dining_hall_id).update(dining_hall_id=instance.dining_hall_id)
@@ -7,6 +7,10 @@ Users can choose specific parameters or fetch all available data.
 
 Usage:
     $ python manage.py test_dining
+    $ python manage.py test_dining --meal lunch --meal dinner --location whitman --date 2024-11-18 --events
+
+Passing any option (or running without a terminal on stdin) skips the prompts and runs
+the given queries directly.
 
 Copyright © 2021-2024 Hoagie Club and affiliates.
 
@@ -22,10 +26,17 @@ copies of the Software, subject to the following conditions:
 This software is provided "as-is", without warranty of any kind.
 """
 
+import argparse
+import asyncio
+import re
 from datetime import datetime
-from hoagiemeal.api.dining import DiningAPI
+from lxml import etree
+from hoagiemeal.api.dining import dining_api
+from hoagiemeal.api.student_app import close_session
 from hoagiemeal.utils.logger import logger
 
+MEAL_TYPES = ["breakfast", "lunch", "brunch", "dinner"]
+
 
 def prompt_user_choice(prompt, choices):
     """Prompt the user to select a choice from the provided list.
@@ -113,7 +124,7 @@ def get_user_queries():
     if prompt_yes_no("Do you want to specify meal types?"):
         meal_types = []
         while True:
-            meal_type = prompt_user_choice("Select a meal type to add:", ["breakfast", "lunch", "brunch", "dinner"])
+            meal_type = prompt_user_choice("Select a meal type to add:", MEAL_TYPES)
             if meal_type not in meal_types:
                 meal_types.append(meal_type)
                 print(f"Added '{meal_type.capitalize()}'.")
@@ -181,12 +192,11 @@ def filter_locations(locations, search_terms):
         list: A list of matching location dictionaries.
 
     """
-    filtered = []
-    for loc in locations:
-        name = loc.get("name", "").lower()
-        if any(term.lower() in name for term in search_terms):
-            filtered.append(loc)
-    return filtered
+    if not search_terms:
+        return []
+    # One alternation of every term, so each name is scanned once rather than once per term.
+    pattern = re.compile("|".join(re.escape(term.lower()) for term in search_terms))
+    return [loc for loc in locations if pattern.search(loc.get("name", "").lower())]
 
 
 def display_locations(locations):
@@ -200,37 +210,36 @@ def display_locations(locations):
         print("No dining locations found matching your criteria.")
         return
 
-    print("\nAvailable Dining Locations:")
-    for idx, loc in enumerate(locations, 1):
-        name = loc.get("name", "Unknown Name")
-        dbid = loc.get("dbid", "Unknown DBID")
-        print(f"{idx}. {name} (DBID: {dbid})")
-    print("---" * 20)
+    lines = ["\nAvailable Dining Locations:"]
+    lines.extend(
+        f"{idx}. {loc.get('name', 'Unknown Name')} (DBID: {loc.get('dbid', 'Unknown DBID')})"
+        for idx, loc in enumerate(locations, 1)
+    )
+    lines.append("---" * 20)
+    # Emit the whole listing in one write rather than one per line.
+    print("\n".join(lines))
 
 
 def display_menus(menu_data, location_name):
     """Display menu items for a given location.
 
     Args:
-        menu_data (dict): The menu data dictionary.
+        menu_data (MenuResponse): The decoded menu response.
         location_name (str): The name of the dining location.
 
     """
-    if not menu_data or "menus" not in menu_data:
+    if not menu_data or not menu_data.menus:
         print(f"No menu data available for {location_name}.")
         return
 
-    print(f"\nDining Menu for {location_name}:")
-    for item in menu_data["menus"]:
-        menu_id = item.get("id", "N/A")
-        menu_name = item.get("name", "N/A")
-        description = item.get("description", "No Description")
-        link = item.get("link", "No Link")
-        print(f" - Menu Item ID: {menu_id}")
-        print(f"   Name: {menu_name}")
-        print(f"   Description: {description}")
-        print(f"   Link: {link}")
-    print("---" * 20)
+    lines = [f"\nDining Menu for {location_name}:"]
+    for item in menu_data.items():
+        lines.append(f" - Menu Item ID: {item.id}")
+        lines.append(f"   Name: {item.name}")
+        lines.append(f"   Description: {item.description or 'No Description'}")
+        lines.append(f"   Link: {item.link or 'No Link'}")
+    lines.append("---" * 20)
+    print("\n".join(lines))
 
 
 def display_events(events):
@@ -244,21 +253,64 @@ def display_events(events):
         print("No dining events available.")
         return
 
-    print("\nDining Events:")
+    lines = ["\nDining Events:"]
     for event in events:
         summary = event.get("summary", "No Summary")
         start = event.get("start", "No Start Time")
         end = event.get("end", "No End Time")
         uid = event.get("uid", "No UID")
         description = event.get("description", "No Description")
-        print(f"Event Summary: {summary}")
-        print(f"Start: {start}, End: {end}")
-        print(f"UID: {uid}")
-        print(f"Description: {description}")
-        print("---" * 10)
+        lines.append(f"Event Summary: {summary}")
+        lines.append(f"Start: {start}, End: {end}")
+        lines.append(f"UID: {uid}")
+        lines.append(f"Description: {description}")
+        lines.append("---" * 10)
+    print("\n".join(lines))
+
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD command-line argument into a date.
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        date: The parsed date.
+
+    """
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}'. Please use YYYY-MM-DD format.") from e
+
 
+def queries_from_options(meal_types=None, locations=None, dates=None, category_ids=None, fetch_events=False):
+    """Build the query parameters from command-line options instead of prompts.
 
-def execute_queries(dining_api, queries):
+    Options that were not given are left out, as if the user had said 'n' to them.
+
+    Args:
+        meal_types (list): Meal types to fetch.
+        locations (list): Terms to search for in location names.
+        dates (list): Dates to fetch menus for.
+        category_ids (list): Location category IDs.
+        fetch_events (bool): Whether to fetch dining events.
+
+    Returns:
+        dict: A dictionary containing the query parameters.
+
+    """
+    options = {
+        "meal_types": list(dict.fromkeys(meal_types)) if meal_types else None,
+        "locations": locations,
+        "dates": dates,
+        "category_ids": list(dict.fromkeys(category_ids)) if category_ids else None,
+        "fetch_events": fetch_events or None,
+    }
+    return {key: value for key, value in options.items() if value}
+
+
+async def execute_queries(dining_api, queries):
     """Execute the user's queries against the DiningAPI.
 
     Args:
@@ -273,15 +325,19 @@ def execute_queries(dining_api, queries):
         category_ids = queries.get("category_ids", ["2"])  # Default to ["2"] if not specified
         # Adjusting _make_request to handle multiple category_ids
         # Assuming the API accepts multiple category IDs by repeating the parameter
-        params = {"categoryId": category_ids}
+        params = [("categoryId", category_id) for category_id in category_ids]
         logger.info(f"Fetching dining locations with category IDs: {', '.join(category_ids)}")
-        locations_response = dining_api._make_request(dining_api.DINING_LOCATIONS, params=params, fmt="xml")
-        schema = dining_api.schemas.get_dining_xsd()
-        if not dining_api.validate_xml(locations_response, schema):
-            logger.error("Invalid XML format for dining locations.")
+        locations_response = await dining_api._make_request(dining_api.DINING_LOCATIONS, params=params, fmt="xml")
+        # Validate against the XSD while parsing, so the document is only parsed once.
+        try:
+            root = etree.fromstring(locations_response, await dining_api.get_dining_parser())
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Invalid XML format for dining locations: {e}")
             print("Failed to validate dining locations XML.")
             return
-        all_locations = dining_api._parse_xml(locations_response).get("locations", {}).get("location", [])
+        # Convert the validated tree the same way get_locations does, so a single location
+        # or amenity still comes back as a list.
+        all_locations = list(dining_api._iterparse_xml(root, "location", force_list=("amenity",)))
         logger.debug(f"All Locations: {all_locations}")
 
         # Filter locations if location queries are specified
@@ -299,6 +355,7 @@ def execute_queries(dining_api, queries):
         dates = queries.get("dates", [datetime.today().date()])
         meal_types = queries.get("meal_types", ["Dinner"])
 
+        menu_requests = []
         for date in dates:
             date_str = date.strftime("%Y-%m-%d")
             for meal_type in meal_types:
@@ -308,18 +365,25 @@ def execute_queries(dining_api, queries):
                     name = loc.get("name", "Unknown Name")
                     dbid = loc.get("dbid", "Unknown DBID")
                     logger.info(f"Fetching menu for {name} (DBID: {dbid}) on {date_str} for {meal_cap}...")
-                    try:
-                        menu_data = dining_api.get_menu(location_id=dbid, menu_id=menu_id)
-                        display_menus(menu_data, name)
-                    except Exception as e:
-                        logger.error(f"Error fetching menu for {name} (DBID: {dbid}): {e}")
-                        print(f"Failed to fetch menu for {name} (DBID: {dbid}). Check logs for details.")
+                    menu_requests.append((name, dbid, menu_id))
+
+        # Fetch every requested menu concurrently, then display them in request order.
+        menus = await asyncio.gather(
+            *(dining_api.get_menu(location_id=dbid, menu_id=menu_id) for _, dbid, menu_id in menu_requests),
+            return_exceptions=True,
+        )
+        for (name, dbid, _), menu_data in zip(menu_requests, menus, strict=True):
+            if isinstance(menu_data, Exception):
+                logger.error(f"Error fetching menu for {name} (DBID: {dbid}): {menu_data}")
+                print(f"Failed to fetch menu for {name} (DBID: {dbid}). Check logs for details.")
+                continue
+            display_menus(menu_data, name)
 
         # Fetch and display events if requested
         if queries.get("fetch_events"):
             logger.info("\nFetching dining events...")
             try:
-                events = dining_api.get_events(place_id="1007").get("events", [])
+                events = (await dining_api.get_events(place_id="1007")).get("events", [])
                 display_events(events)
             except Exception as e:
                 logger.error(f"Error fetching dining events: {e}")
@@ -328,14 +392,22 @@ def execute_queries(dining_api, queries):
     except Exception as e:
         logger.error(f"An error occurred while executing queries: {e}")
         print("An unexpected error occurred. Check logs for details.")
+    finally:
+        await close_session()
 
 
-def main():
+def main(queries=None):
     """The main function to run the interactive test client.
+
+    Args:
+        queries (dict): Query parameters to run without prompting. If omitted, they are
+            collected interactively.
+
     """
-    dining_api = DiningAPI()
-    queries = get_user_queries()
-    execute_queries(dining_api, queries)
+    if queries is None:
+        queries = get_user_queries()
+    # Reuse the app's shared DiningAPI, whose access token and schema are cached per process.
+    asyncio.run(execute_queries(dining_api, queries))
     print("\nThank you for using the interactive dining API test client. Hope you found what you were looking for!")
 
 
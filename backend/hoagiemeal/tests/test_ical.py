@@ -0,0 +1,100 @@
+"""Tests for the single-pass iCal scanner used by StudentApp._parse_ical.
+
+Copyright © 2021-2024 Hoagie Club and affiliates.
+
+Licensed under the MIT License. You may obtain a copy of the License at:
+https://github.com/hoagieclub/meal/blob/main/LICENSE
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, subject to the following conditions:
+
+This software is provided "as-is", without warranty of any kind.
+"""
+
+import datetime
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+
+from hoagiemeal.api.student_app import StudentApp
+from hoagiemeal.utils.logger import logger
+
+
+def _calendar(*events: str) -> str:
+    """Wrap VEVENT bodies in a VCALENDAR document with CRLF line endings."""
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Hoagie//Meal//EN", "X-WR-CALNAME:Dining"]
+    for event in events:
+        lines += ["BEGIN:VEVENT", *event.strip().splitlines(), "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+class ScanIcalTests(SimpleTestCase):
+    """Check that the scanner agrees with the full icalendar parser."""
+
+    def assertMatchesStrict(self, ical_text: str) -> dict:
+        """Assert both parsers return the same result, and return it."""
+        scanned = StudentApp._parse_ical(ical_text)
+        self.assertEqual(scanned, StudentApp._parse_ical(ical_text, strict=True))
+        return scanned
+
+    def test_folded_lines(self):
+        """Continuation lines starting with a space or tab are joined to the previous line."""
+        ical_text = _calendar(
+            "UID:folded\nSUMMARY:Brunch at\n  Rockefeller\nDTSTART:20241118T150000Z\nDTEND:20241118T170000Z\n"
+            "DESCRIPTION:Omelets, waff\n\tles and fruit"
+        )
+        event = self.assertMatchesStrict(ical_text)["events"][0]
+        self.assertEqual(event["summary"], "Brunch at Rockefeller")
+        self.assertEqual(event["description"], "Omelets, waffles and fruit")
+
+    def test_escaped_text(self):
+        """Escaped commas, semicolons, backslashes and newlines are unescaped."""
+        ical_text = _calendar(
+            "UID:escaped\nSUMMARY:Lunch\\, Rocky\\; Mathey\nDTSTART:20241118T163000Z\nDTEND:20241118T190000Z\n"
+            "DESCRIPTION:Line one\\nLine two \\\\ end"
+        )
+        event = self.assertMatchesStrict(ical_text)["events"][0]
+        self.assertEqual(event["summary"], "Lunch, Rocky; Mathey")
+        self.assertEqual(event["description"], "Line one\nLine two \\ end")
+
+    def test_tzid(self):
+        """A TZID parameter, quoted or not, attaches that zone to the time."""
+        ical_text = _calendar(
+            'UID:tzid\nSUMMARY:Dinner\nDTSTART;TZID="America/New_York":20241118T170000\n'
+            "DTEND;TZID=America/New_York:20241118T200000"
+        )
+        event = self.assertMatchesStrict(ical_text)["events"][0]
+        self.assertEqual(event["start"], datetime.datetime(2024, 11, 18, 17, tzinfo=ZoneInfo("America/New_York")))
+
+    def test_unknown_tzid_is_floating(self):
+        """A TZID that is not an IANA zone name leaves the time floating instead of raising."""
+        ical_text = _calendar(
+            "UID:unknown\nSUMMARY:Dinner\nDTSTART;TZID=Campus Time:20241118T170000\n"
+            "DTEND;TZID=Campus Time:20241118T200000"
+        )
+        with self.assertLogs(logger, level="WARNING"):
+            event = self.assertMatchesStrict(ical_text)["events"][0]
+        self.assertEqual(event["start"], datetime.datetime(2024, 11, 18, 17))
+
+    def test_all_day_dates(self):
+        """VALUE=DATE properties are parsed as dates."""
+        ical_text = _calendar("UID:date\nSUMMARY:Closed\nDTSTART;VALUE=DATE:20241128\nDTEND;VALUE=DATE:20241129")
+        event = self.assertMatchesStrict(ical_text)["events"][0]
+        self.assertEqual(event["start"], datetime.date(2024, 11, 28))
+
+    def test_nested_alarm(self):
+        """Properties of a VALARM inside an event do not overwrite the event's own."""
+        ical_text = _calendar(
+            "UID:alarm\nSUMMARY:Breakfast\nDTSTART:20241118T120000Z\nDTEND:20241118T150000Z\n"
+            "DESCRIPTION:Hot breakfast\nBEGIN:VALARM\nACTION:DISPLAY\nDESCRIPTION:Reminder\nTRIGGER:-PT15M\n"
+            "END:VALARM",
+            "UID:second\nSUMMARY:Lunch\nDTSTART:20241118T163000Z\nDTEND:20241118T190000Z",
+        )
+        result = self.assertMatchesStrict(ical_text)
+        self.assertEqual([event["uid"] for event in result["events"]], ["alarm", "second"])
+        self.assertEqual(result["events"][0]["description"], "Hot breakfast")
+        self.assertEqual(result["calendar_info"]["calname"], "Dining")
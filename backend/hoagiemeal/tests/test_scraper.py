@@ -0,0 +1,95 @@
+"""Tests for the dining hall label page scraper.
+
+Copyright © 2021-2024 Hoagie Club and affiliates.
+
+Licensed under the MIT License. You may obtain a copy of the License at:
+https://github.com/hoagieclub/meal/blob/main/LICENSE
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, subject to the following conditions:
+
+This software is provided "as-is", without warranty of any kind.
+"""
+
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from hoagiemeal.api import scraper
+from hoagiemeal.api.scraper import Scraper
+
+LABEL_HTML = (Path(__file__).parent / "fixtures" / "label.html").read_bytes()
+
+# What the original per-field XPath extraction returned for fixtures/label.html.
+EXPECTED_INFO = {
+    "Name": "Chicken Tikka Masala",
+    "Serving Size": "4 oz",
+    "Calories": "250",
+    "Calories from Fat": "90",
+    "Ingredients": ["Chicken", "Tomato", "Cream", "Spices"],
+    "Allergens": ["Milk", "Soy"],
+    "Fat": {
+        "Total Fat": {"Amount": "10g", "Daily Value": "15%"},
+        "Saturated Fat": {"Amount": "3g", "Daily Value": "15%"},
+        "Trans Fat": {"Amount": "0g", "Daily Value": ""},
+    },
+    "Cholesterol": {"Amount": "45mg", "Daily Value": "15%"},
+    "Sodium": {"Amount": "600mg", "Daily Value": "26%"},
+    "Carbohydrates": {
+        "Total Carbohydrates": {"Amount": "20g", "Daily Value": "7%"},
+        "Dietary Fiber": {"Amount": "2g", "Daily Value": "8%"},
+        "Sugar": {"Amount": "5g", "Daily Value": ""},
+    },
+    "Protein": {"Amount": "18g", "Daily Value": "36%"},
+    "Vitamins": {
+        "Vitamin D": {"Amount": "", "Daily Value": "10%"},
+        "Calcium": {"Amount": "", "Daily Value": "4%"},
+        "Iron": {"Amount": "", "Daily Value": ""},
+        "Potassium": {"Amount": "", "Daily Value": "8%"},
+    },
+}
+
+
+class FakeStreamedResponse:
+    """Stand-in for a streamed requests.Response that serves a body in small chunks."""
+
+    def __init__(self, body: bytes, headers: dict | None = None):
+        """Serve `body` with the given response headers."""
+        self.body = body
+        self.headers = headers or {}
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size: int):
+        """Yield the body in chunks, counting how much of it was read."""
+        for start in range(0, len(self.body), chunk_size):
+            chunk = self.body[start : start + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+class ScraperExtractionTests(SimpleTestCase):
+    """Check the single-pass extraction against the output of the original one."""
+
+    def test_get_info_matches_original_extraction(self):
+        """get_info extracts the same fields from a parsed label page."""
+        tree = scraper._parse_html(LABEL_HTML)
+        self.assertEqual(Scraper.get_info(tree), EXPECTED_INFO)
+
+    def test_extract_matches_original_extraction(self):
+        """_extract parses and extracts a raw label page body the same way."""
+        self.assertEqual(scraper._extract(LABEL_HTML), EXPECTED_INFO)
+
+    def test_get_info_without_tree_returns_empty_schema(self):
+        """A missing tree yields the empty schema rather than an error."""
+        self.assertEqual(Scraper.get_info(None), scraper._new_schema())
+
+    def test_stream_parse_matches_and_reads_whole_body(self):
+        """Streamed parsing extracts the same fields and still reads the rest of the body."""
+        padded = LABEL_HTML.replace(b"</body>", b"<p>padding</p>" * 2000 + b"</body>")
+        response = FakeStreamedResponse(padded)
+        tree = Scraper()._stream_parse("https://example.com/label", response)
+        self.assertEqual(Scraper.get_info(tree), EXPECTED_INFO)
+        self.assertEqual(response.bytes_read, len(padded))
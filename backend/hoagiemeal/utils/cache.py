@@ -0,0 +1,68 @@
+"""Caching decorators for the Hoagie Meal backend.
+
+Copyright © 2021-2024 Hoagie Club and affiliates.
+
+Licensed under the MIT License. You may obtain a copy of the License at:
+
+    https://github.com/hoagieclub/meal/blob/main/LICENSE
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, subject to the following conditions:
+
+This software is provided "as-is", without warranty of any kind.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+
+from django.core.cache import caches
+from hoagiemeal.utils.logger import logger
+
+
+def parsed_cache(timeout: int = 900, key: Callable[..., str] | None = None):
+    """Cache the parsed result of an async API method in Django's default cache.
+
+    Unlike `cache_page`, which stores the rendered response, this stores the Python
+    object returned by the method, so a hit skips both the upstream request and the
+    XML/iCal/JSON parsing.
+
+    Args:
+        timeout (int): Number of seconds to keep a result. Defaults to 900.
+        key (Callable): Optional function receiving the method's arguments (without
+            `self`) and returning the cache key. Defaults to the method's qualified
+            name followed by its bound arguments.
+
+    Returns:
+        Callable: The original coroutine function wrapped with a cache lookup.
+
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def default_key(*args, **kwargs) -> str:
+            bound = signature.bind(None, *args, **kwargs)
+            bound.apply_defaults()
+            params = list(bound.arguments.items())[1:]  # Skip self
+            return ":".join([func.__qualname__, *(f"{name}={value}" for name, value in params)])
+
+        make_key = key or default_key
+
+        @functools.wraps(func)
+        async def wrapped_func(self, *args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            cache = caches["default"]
+            result = await cache.aget(cache_key)
+            if result is not None:
+                logger.debug(f"Cache hit for {cache_key}.")
+                return result
+            result = await func(self, *args, **kwargs)
+            await cache.aset(cache_key, result, timeout)
+            return result
+
+        return wrapped_func
+
+    return decorator
@@ -16,24 +16,36 @@ This software is provided "as-is", without warranty of any kind.
 """
 
 import functools
+import warnings
+
 from hoagiemeal.utils.logger import logger
 
+
 def deprecated(reason: str = ""):
     """Mark a function as deprecated.
 
+    The deprecation is reported once per function, on its first call, both to the logger
+    and as a DeprecationWarning pointing at the caller.
+
     Args:
         reason (str): Optional reason for the deprecation. Defaults to an empty string.
 
     Returns:
-        Callable: The original function wrapped to log a deprecation warning.
+        Callable: The original function wrapped to report its deprecation.
 
     """
     def decorator(func):
+        message = f"Deprecated function {func.__name__} called. Reason: {reason}"
+
         @functools.wraps(func)
         def wrapped_func(*args, **kwargs):
-            logger.warning(f"Deprecated function {func.__name__} called. Reason: {reason}")
+            if not wrapped_func.warned:
+                wrapped_func.warned = True
+                logger.warning(message)
+                warnings.warn(message, DeprecationWarning, stacklevel=2)
             return func(*args, **kwargs)
 
+        wrapped_func.warned = False
         return wrapped_func
 
     return decorator
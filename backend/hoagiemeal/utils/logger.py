@@ -56,6 +56,11 @@ class ColorFormatter(logging.Formatter):
         super().__init__(
             fmt or "%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s", "%Y-%m-%d %H:%M:%S"
         )
+        # Colored level names never change, so build them once instead of per record.
+        self._level_strs = {
+            levelno: f"{color}{logging.getLevelName(levelno)}{Style.RESET_ALL}"
+            for levelno, color in self.LOG_COLORS.items()
+        }
 
     def format(self, record):
         """Format a log record with the appropriate color based on the log level.
@@ -67,21 +72,26 @@ class ColorFormatter(logging.Formatter):
             str: The formatted log message with the corresponding color applied.
 
         """
-        # Apply color based on the log level
-        level_color = self.LOG_COLORS.get(record.levelno, Fore.WHITE)
-        time_str = f"{self.TIME_COLOR}{self.formatTime(record)}{Style.RESET_ALL}"
-        levelname_str = f"{level_color}{record.levelname}{Style.RESET_ALL}"
-        file_info_str = f"{self.FILE_COLOR}{record.filename}:{record.lineno}{Style.RESET_ALL}"
+        levelname_str = self._level_strs.get(record.levelno) or f"{Fore.WHITE}{record.levelname}{Style.RESET_ALL}"
 
         # Format the log message with color
-        log_msg = f"{time_str} - {levelname_str} - {file_info_str} - {record.msg}"
+        log_msg = (
+            f"{self.TIME_COLOR}{self.formatTime(record, self.datefmt)}{Style.RESET_ALL} - {levelname_str} - "
+            f"{self.FILE_COLOR}{record.filename}:{record.lineno}{Style.RESET_ALL} - {record.getMessage()}"
+        )
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_msg = f"{log_msg}\n{record.exc_text}"
         return log_msg
 
 
 def setup_logger():
     """Set up a logger with a custom color formatter that logs to standard output (stdout).
     
-    The logger is configured with the ColorFormatter to format log messages with color based on the log level.
+    On a terminal, the logger is configured with the ColorFormatter to format log messages with color based on
+    the log level; otherwise a plain formatter with the same layout is used.
     The log level is set to INFO by default, but this can be changed to show more or less detailed messages.
 
     Returns:
@@ -90,8 +100,14 @@ def setup_logger():
     """
     handler = logging.StreamHandler(sys.stdout)
 
-    # Set custom formatter
-    formatter = ColorFormatter()
+    # Set custom formatter. Colors are only useful on a terminal; piped or redirected
+    # output (e.g. in production) gets a plain formatter with the same layout.
+    if sys.stdout.isatty():
+        formatter = ColorFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s", "%Y-%m-%d %H:%M:%S"
+        )
     handler.setFormatter(formatter)
     logger = logging.getLogger(__name__)
 